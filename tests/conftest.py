@@ -0,0 +1,57 @@
+import os
+
+import pytest
+import torch
+
+if os.environ.get("CI"):
+    # CI runners are oversubscribed; a single intra-op thread avoids the
+    # pool thrashing that slows the CNN-heavy tests down.
+    torch.set_num_threads(1)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-compile",
+        action="store_true",
+        default=False,
+        help="skip tests that exercise torch.compile",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: marks tests that build or train CNN-scale networks"
+    )
+    config.addinivalue_line("markers", "cuda: marks tests that require a CUDA device")
+    config.addinivalue_line(
+        "markers", "compile: marks tests that exercise torch.compile"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.pluginmanager.hasplugin("xdist"):
+        # Under pytest-xdist, keep each module's tests on one worker
+        # (--dist loadgroup) so module-scoped caches are filled once per
+        # worker instead of once per test.
+        for item in items:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+    if config.getoption("--no-compile"):
+        skip_compile = pytest.mark.skip(reason="--no-compile given")
+        for item in items:
+            if "compile" in item.keywords:
+                item.add_marker(skip_compile)
+    if torch.cuda.is_available():
+        return
+    skip_cuda = pytest.mark.skip(reason="CUDA not available")
+    for item in items:
+        if "cuda" in item.keywords:
+            item.add_marker(skip_cuda)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cuda_context():
+    """Touches the CUDA device once up front so the first GPU test doesn't
+    absorb the context-creation latency."""
+    if torch.cuda.is_available():
+        torch.zeros(1, device="cuda")
+    yield
@@ -1,8 +1,10 @@
 import copy
+import io
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from unittest.mock import MagicMock
 
-import dill
 import numpy as np
 import pytest
 import torch
@@ -18,6 +20,23 @@ from agilerl.networks.evolvable_mlp import EvolvableMLP
 from agilerl.utils.utils import make_multi_agent_vect_envs
 from agilerl.wrappers.make_evolvable import MakeEvolvable
 
+_HAS_CUDA = torch.cuda.is_available()
+
+# Dedicated RNG for test tensors so fixtures neither contend on nor disturb
+# the global torch generator.
+_TORCH_RNG = torch.Generator().manual_seed(0)
+
+
+def _randn(*shape):
+    return torch.empty(shape).normal_(generator=_TORCH_RNG)
+
+
+def _load_checkpoint_file(path):
+    """Loads a raw checkpoint dict, importing dill lazily on first use."""
+    import dill
+
+    return torch.load(path, pickle_module=dill)
+
 
 class DummyMultiEnv:
     def __init__(self, state_dims, action_dims):
@@ -30,18 +49,22 @@ class DummyMultiEnv:
         self.action_space = None
 
     def reset(self, seed=None, options=None):
-        return {agent: np.random.rand(*self.state_dims) for agent in self.agents}, {
+        states = np.random.rand(len(self.agents), *self.state_dims)
+        return dict(zip(self.agents, states)), {
             "info_string": None,
             "agent_mask": {"agent_0": False, "agent_1": True},
             "env_defined_actions": {"agent_0": np.array([0, 1]), "agent_1": None},
         }
 
     def step(self, action):
+        states = np.random.rand(len(self.agents), *self.state_dims)
+        rewards = np.random.randint(0, 5, len(self.agents))
+        dones = np.random.randint(0, 2, len(self.agents))
         return (
-            {agent: np.random.rand(*self.state_dims) for agent in self.agents},
-            {agent: np.random.randint(0, 5) for agent in self.agents},
+            dict(zip(self.agents, states)),
+            dict(zip(self.agents, rewards)),
             {agent: 1 for agent in self.agents},
-            {agent: np.random.randint(0, 2) for agent in self.agents},
+            dict(zip(self.agents, dones)),
             {agent: "info_string" for agent in self.agents},
         )
 
@@ -132,109 +155,575 @@ class DummyEvolvableCNN(EvolvableCNN):
         return DummyNoSync()
 
 
+# Shared two-agent defaults used throughout the file.
+AGENT_IDS = ["agent_0", "agent_1"]
+MLP_STATE_DIMS = [(6,), (6,)]
+
+
+_DUMMY_MLP_CACHE: dict = {}
+
+
+def _get_dummy_mlp(num_inputs, num_outputs, hidden_size, device, output_activation):
+    """Returns a cached DummyEvolvableMLP for the given architecture; the
+    distributed get_action test only runs forward passes against it."""
+    key = (num_inputs, num_outputs, tuple(hidden_size), str(device), output_activation)
+    if key not in _DUMMY_MLP_CACHE:
+        _DUMMY_MLP_CACHE[key] = DummyEvolvableMLP(
+            num_inputs=num_inputs,
+            num_outputs=num_outputs,
+            hidden_size=list(hidden_size),
+            device=device,
+            mlp_output_activation=output_activation,
+        )
+    return _DUMMY_MLP_CACHE[key]
+
+
+_ACCELERATOR_CACHE: dict = {}
+
+
+def _shared_accelerator(device_placement=True):
+    """Returns a process-wide Accelerator. Accelerate shares its state
+    globally anyway, so constructing one per test only repeats setup."""
+    if device_placement not in _ACCELERATOR_CACHE:
+        _ACCELERATOR_CACHE[device_placement] = Accelerator(
+            device_placement=device_placement
+        )
+    return _ACCELERATOR_CACHE[device_placement]
+
+
+_MATD3_CACHE: dict = {}
+
+
+def _get_matd3(key, **kwargs):
+    """Returns a cached MATD3 instance, constructing it on first use.
+
+    Building the evolvable networks and their optimizers dominates test
+    wall-time, so tests that only read agent attributes share one instance
+    per configuration instead of rebuilding from scratch. Tests that mutate
+    a cached agent must undo the change before finishing.
+    """
+    if key not in _MATD3_CACHE:
+        _MATD3_CACHE[key] = MATD3(**kwargs)
+    return _MATD3_CACHE[key]
+
+
+_CLONE_CONFIG_ATTRIBUTES = (
+    "state_dims",
+    "action_dims",
+    "one_hot",
+    "n_agents",
+    "agent_ids",
+    "max_action",
+    "min_action",
+    "discrete_actions",
+    "index",
+    "net_config",
+    "batch_size",
+    "lr_actor",
+    "lr_critic",
+    "learn_step",
+    "gamma",
+    "tau",
+    "device",
+    "accelerator",
+)
+
+
+def _all_networks(matd3):
+    """Chains the six actor/critic network lists of a MATD3 agent."""
+    return chain(
+        matd3.actors,
+        matd3.critics_1,
+        matd3.critics_2,
+        matd3.actor_targets,
+        matd3.critic_targets_1,
+        matd3.critic_targets_2,
+    )
+
+
+def _all_optimizers(matd3):
+    return chain(
+        matd3.actor_optimizers, matd3.critic_1_optimizers, matd3.critic_2_optimizers
+    )
+
+
+_LOADED_CONFIG_ATTRIBUTES = (
+    "state_dims",
+    "action_dims",
+    "one_hot",
+    "n_agents",
+    "agent_ids",
+    "min_action",
+    "max_action",
+    "net_config",
+    "lr_actor",
+    "lr_critic",
+    "batch_size",
+    "learn_step",
+    "gamma",
+    "tau",
+    "mut",
+    "index",
+    "scores",
+    "fitness",
+    "steps",
+)
+
+
+def _assert_loaded_config_equal(new_matd3, matd3):
+    """Diffs the scalar configuration of a loaded agent against its
+    reference in one comparison, so a failure reports every differing
+    field at once."""
+    new_config = {attr: getattr(new_matd3, attr) for attr in _LOADED_CONFIG_ATTRIBUTES}
+    config = {attr: getattr(matd3, attr) for attr in _LOADED_CONFIG_ATTRIBUTES}
+    assert new_config == config
+
+
+_REFERENCE_SD_CACHE = weakref.WeakKeyDictionary()
+
+
+def _reference_state_dict(module):
+    """CPU state dict of a fixture-owned reference module, memoized because
+    the same reference agents are compared against every parametrize row and
+    their weights never change once built."""
+    try:
+        return _REFERENCE_SD_CACHE[module]
+    except KeyError:
+        state_dict = _state_dict_to_cpu(module)
+        _REFERENCE_SD_CACHE[module] = state_dict
+        return state_dict
+
+
+def _assert_matches_reference(module, reference_module):
+    state_dict = _state_dict_to_cpu(module)
+    reference = _reference_state_dict(reference_module)
+    assert state_dict.keys() == reference.keys()
+    for key, tensor in state_dict.items():
+        torch.testing.assert_close(tensor, reference[key], rtol=0, atol=0, msg=key)
+
+
+def _assert_all_networks_equal(matd3, reference_matd3):
+    """Compares the agent's networks against the reference pairwise on a
+    thread pool, so the device-to-host copies and tensor comparisons overlap
+    across modules."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in executor.map(
+            _assert_matches_reference,
+            _all_networks(matd3),
+            _all_networks(reference_matd3),
+        ):
+            pass
+
+
+def _assert_clone_config_equal(clone_agent, agent):
+    """Diffs the scalar configuration of a clone against its source in one
+    comparison, so a failure reports every differing field at once."""
+    clone_config = {
+        attr: getattr(clone_agent, attr) for attr in _CLONE_CONFIG_ATTRIBUTES
+    }
+    config = {attr: getattr(agent, attr) for attr in _CLONE_CONFIG_ATTRIBUTES}
+    assert clone_config == config
+    assert np.array_equal(clone_agent.expl_noise, agent.expl_noise)
+
+
+def _state_dict_to_cpu(module):
+    """Copies a module's state dict to the CPU, reusing tensors that are
+    already there and synchronizing once on any queued device-to-host
+    transfers rather than blocking on every tensor."""
+    state_dict = {}
+    transferred = False
+    for key, tensor in module.state_dict().items():
+        if tensor.device.type == "cpu":
+            state_dict[key] = tensor
+        else:
+            state_dict[key] = tensor.to("cpu", non_blocking=True)
+            transferred = True
+    if transferred:
+        torch.cuda.synchronize()
+    return state_dict
+
+
+def _assert_state_dicts_equal(module_1, module_2):
+    """Compares two modules' weights tensor-by-tensor, avoiding rendering
+    every state dict to a string just to test equality."""
+    state_dict_1 = _state_dict_to_cpu(module_1)
+    state_dict_2 = _state_dict_to_cpu(module_2)
+    assert state_dict_1.keys() == state_dict_2.keys()
+    for key, tensor in state_dict_1.items():
+        torch.testing.assert_close(tensor, state_dict_2[key], rtol=0, atol=0, msg=key)
+
+
+def _state_dict_bytes(module):
+    """Serializes a module's weights into an in-memory buffer. Exact and
+    cheaper than deep-copying, and unlike str() it does not truncate large
+    tensors, so inequality checks see every element."""
+    buffer = io.BytesIO()
+    torch.save(module.state_dict(), buffer)
+    return buffer.getvalue()
+
+
+def _state_dict_snapshots(modules):
+    """Snapshots each module's weights for before/after comparisons."""
+    return [_state_dict_bytes(module) for module in modules]
+
+
+_NP_RNG = np.random.default_rng(0)
+
+
+def _assert_valid_actions(cont_actions, discrete_action, action_dims, discrete_actions):
+    """Vectorized checks on a get_action output pair."""
+    for idx, env_actions in enumerate(cont_actions.values()):
+        env_actions = np.asarray(env_actions)
+        assert env_actions.shape[-1] == action_dims[idx]
+        assert env_actions.dtype == np.float32
+        if discrete_actions:
+            sums = env_actions.sum(axis=-1)
+            assert np.all(
+                np.isclose(sums, 1.0, atol=0.1, rtol=1e-3)
+                | np.isclose(sums, 0.0, atol=0.1, rtol=1e-3)
+            ), sums
+        assert np.all((env_actions >= -1.0) & (env_actions <= 1.0)), env_actions
+    if discrete_actions:
+        for idx, env_action in enumerate(discrete_action.values()):
+            assert np.all(np.asarray(env_action) <= action_dims[idx] - 1)
+
+
+_RANDOM_STATE_CACHE: dict = {}
+
+
+def _random_state(agent_ids, state_dims, one_hot=False):
+    """Returns a per-agent observation dict sliced from one stacked array,
+    memoized per (agent_ids, state_dims, one_hot) signature. get_action only
+    reads the arrays, so all parametrize rows can share one dict."""
+    key = (tuple(agent_ids), tuple(tuple(dim) for dim in state_dims), one_hot)
+    if key not in _RANDOM_STATE_CACHE:
+        if one_hot:
+            stacked = _NP_RNG.integers(0, state_dims[0][0], (len(agent_ids), 1))
+        else:
+            stacked = _NP_RNG.standard_normal(
+                (len(agent_ids), *state_dims[0]), dtype=np.float32
+            )
+        _RANDOM_STATE_CACHE[key] = {
+            agent: stacked[idx] for idx, agent in enumerate(agent_ids)
+        }
+    return _RANDOM_STATE_CACHE[key]
+
+
+_INPUT_TENSOR_CACHE: dict = {}
+
+
+def _input_tensor(*shape):
+    """Returns a shared random example tensor for MakeEvolvable tracing."""
+    if shape not in _INPUT_TENSOR_CACHE:
+        _INPUT_TENSOR_CACHE[shape] = _randn(*shape)
+    return _INPUT_TENSOR_CACHE[shape]
+
+
+_MAKE_EVOLVABLE_CACHE: dict = {}
+
+
+def _make_evolvable(network, input_tensor, secondary_input_tensor=None, **kwargs):
+    """Builds a MakeEvolvable network without autograd tracking, since the
+    architecture-detection forward passes only need activation shapes. The
+    traced wrapper is memoized per (network, input shapes, options) and each
+    caller gets its own deepcopy, so tests that wrap the same prototype do
+    not repeat the hook-based trace. The network itself is part of the key —
+    modules hash by identity and the reference pins them against id reuse."""
+    key = (
+        network,
+        tuple(input_tensor.shape),
+        None if secondary_input_tensor is None else tuple(secondary_input_tensor.shape),
+        tuple(sorted(kwargs.items())),
+    )
+    if key not in _MAKE_EVOLVABLE_CACHE:
+        with torch.no_grad():
+            _MAKE_EVOLVABLE_CACHE[key] = MakeEvolvable(
+                network,
+                input_tensor,
+                secondary_input_tensor=secondary_input_tensor,
+                **kwargs,
+            )
+    return copy.deepcopy(_MAKE_EVOLVABLE_CACHE[key])
+
+
+_EVO_PROTOTYPE_CACHE: dict = {}
+
+
+def _evo_network_prototypes(net, state_dim, action_dims):
+    """Builds (once per configuration) the actor/critic evolvable network
+    prototypes used by the evo-networks test; callers deepcopy per slot."""
+    key = (net, state_dim, action_dims)
+    if key not in _EVO_PROTOTYPE_CACHE:
+        if net == "mlp":
+            actor = EvolvableMLP(
+                num_inputs=state_dim[0],
+                num_outputs=action_dims[0],
+                hidden_size=[64, 64],
+                mlp_activation="ReLU",
+                mlp_output_activation="Tanh",
+            )
+            critic = EvolvableMLP(
+                num_inputs=state_dim[0] * len(action_dims) + sum(action_dims),
+                num_outputs=1,
+                hidden_size=[64, 64],
+                mlp_activation="ReLU",
+            )
+        else:
+            actor = EvolvableCNN(
+                input_shape=list(state_dim),
+                num_actions=action_dims[0],
+                channel_size=[8, 8],
+                kernel_size=[2, 2],
+                stride_size=[1, 1],
+                hidden_size=[64, 64],
+                mlp_activation="ReLU",
+                multi=True,
+                n_agents=2,
+                mlp_output_activation="Tanh",
+            )
+            critic = EvolvableCNN(
+                input_shape=list(state_dim),
+                num_actions=sum(action_dims),
+                channel_size=[8, 8],
+                kernel_size=[2, 2],
+                stride_size=[1, 1],
+                hidden_size=[64, 64],
+                n_agents=2,
+                critic=True,
+                multi=True,
+                mlp_activation="ReLU",
+            )
+        _EVO_PROTOTYPE_CACHE[key] = (actor, critic)
+    return _EVO_PROTOTYPE_CACHE[key]
+
+
+# The network fixtures below are keyed by the parametrized dims, so every
+# parametrize row that shares shapes reuses one prototype instead of
+# re-initializing weights. Tests only read these networks (MakeEvolvable
+# rebuilds its own layers), so sharing is safe.
+_NETWORK_FIXTURE_CACHE: dict = {}
+
+
 @pytest.fixture
 def mlp_actor(state_dims, action_dims):
-    net = nn.Sequential(
-        nn.Linear(state_dims[0][0], 64),
-        nn.ReLU(),
-        nn.Linear(64, action_dims[0]),
-        GumbelSoftmax(),
-    )
-    return net
+    key = ("mlp_actor", tuple(state_dims[0]), action_dims[0])
+    if key not in _NETWORK_FIXTURE_CACHE:
+        _NETWORK_FIXTURE_CACHE[key] = nn.Sequential(
+            nn.Linear(state_dims[0][0], 64),
+            nn.ReLU(),
+            nn.Linear(64, action_dims[0]),
+            GumbelSoftmax(),
+        )
+    return _NETWORK_FIXTURE_CACHE[key]
 
 
 @pytest.fixture
 def mlp_critic(action_dims, state_dims):
-    net = nn.Sequential(
-        nn.Linear(state_dims[0][0] + action_dims[0], 64), nn.ReLU(), nn.Linear(64, 1)
-    )
-    return net
+    key = ("mlp_critic", tuple(state_dims[0]), action_dims[0])
+    if key not in _NETWORK_FIXTURE_CACHE:
+        _NETWORK_FIXTURE_CACHE[key] = nn.Sequential(
+            nn.Linear(state_dims[0][0] + action_dims[0], 64),
+            nn.ReLU(),
+            nn.Linear(64, 1),
+        )
+    return _NETWORK_FIXTURE_CACHE[key]
 
 
 @pytest.fixture
 def cnn_actor():
-    net = MultiAgentCNNActor()
-    return net
+    if "cnn_actor" not in _NETWORK_FIXTURE_CACHE:
+        _NETWORK_FIXTURE_CACHE["cnn_actor"] = MultiAgentCNNActor()
+    return _NETWORK_FIXTURE_CACHE["cnn_actor"]
 
 
 @pytest.fixture
 def cnn_critic():
-    net = MultiAgentCNNCritic()
-    return net
+    if "cnn_critic" not in _NETWORK_FIXTURE_CACHE:
+        _NETWORK_FIXTURE_CACHE["cnn_critic"] = MultiAgentCNNCritic()
+    return _NETWORK_FIXTURE_CACHE["cnn_critic"]
 
 
 @pytest.fixture
 def device():
-    return "cuda" if torch.cuda.is_available() else "cpu"
+    return "cuda" if _HAS_CUDA else "cpu"
 
 
-@pytest.fixture
-def mocked_accelerator():
-    MagicMock(spec=Accelerator)
+@pytest.fixture(scope="module")
+def matd3_mlp_agent():
+    """Module-scoped simple MLP agent. Tests must leave it as they found
+    it: read only, deepcopy before mutating, or undo in-place changes (the
+    test-loop test pops the fitness entry that MATD3.test appends)."""
+    return _get_matd3(
+        ("base_mlp", (6,)),
+        state_dims=[(6,), (6,)],
+        action_dims=[2, 2],
+        one_hot=False,
+        n_agents=2,
+        agent_ids=AGENT_IDS,
+        max_action=[[1], [1]],
+        min_action=[[-1], [-1]],
+        discrete_actions=True,
+        device="cuda" if _HAS_CUDA else "cpu",
+    )
+
+
+@pytest.fixture(scope="module")
+def _tensor_pool():
+    """Pool of pre-filled random tensors shared by the experience fixtures.
+
+    The CNN-shaped experience batches are several MB per tensor, so they are
+    generated once per (agent, role, shape) with a seeded generator and
+    reused across the parametrize matrix instead of being reallocated per
+    test. Keying on the agent keeps each agent's draws independent, as the
+    critics concatenate the per-agent columns.
+    Tensors are pinned when CUDA is available so device copies can overlap.
+    """
+    pool = {}
+
+    def get(kind, role, shape, high=None, device=None):
+        key = (kind, role, shape, high)
+        if key not in pool:
+            if kind == "randn":
+                tensor = _randn(*shape)
+            else:
+                tensor = torch.randint(0, high, shape, generator=_TORCH_RNG)
+            if _HAS_CUDA:
+                tensor = tensor.pin_memory()
+            pool[key] = tensor
+        if device is not None and device != "cpu":
+            # Cache the device-resident copy too, so each shape pays for a
+            # single host-to-device transfer per module.
+            device_key = key + (device,)
+            if device_key not in pool:
+                pool[device_key] = pool[key].to(device, non_blocking=True)
+            return pool[device_key]
+        return pool[key]
+
+    return get
+
+
+_EXPERIENCES_CACHE: dict = {}
 
 
 @pytest.fixture
-def accelerated_experiences(batch_size, state_dims, action_dims, agent_ids, one_hot):
+def accelerated_experiences(
+    _tensor_pool, batch_size, state_dims, action_dims, agent_ids, one_hot
+):
     state_size = state_dims[0]
     action_size = action_dims[0]
+    key = ("accelerated", batch_size, tuple(state_size), action_size, one_hot)
+    if key in _EXPERIENCES_CACHE:
+        return _EXPERIENCES_CACHE[key]
     if one_hot:
         states = {
-            agent: torch.randint(0, state_size[0], (batch_size, 1)).float()
+            agent: _tensor_pool(
+                "randint", (agent, "states"), (batch_size, 1), state_size[0]
+            ).float()
             for agent in agent_ids
         }
-    else:
-        states = {agent: torch.randn(batch_size, *state_size) for agent in agent_ids}
-
-    actions = {agent: torch.randn(batch_size, action_size) for agent in agent_ids}
-    rewards = {agent: torch.randn(batch_size, 1) for agent in agent_ids}
-    dones = {agent: torch.randint(0, 2, (batch_size, 1)) for agent in agent_ids}
-    if one_hot:
         next_states = {
-            agent: torch.randint(0, state_size[0], (batch_size, 1)).float()
+            agent: _tensor_pool(
+                "randint", (agent, "next_states"), (batch_size, 1), state_size[0]
+            ).float()
             for agent in agent_ids
         }
     else:
+        states = {
+            agent: _tensor_pool("randn", (agent, "states"), (batch_size, *state_size))
+            for agent in agent_ids
+        }
         next_states = {
-            agent: torch.randn(batch_size, *state_size) for agent in agent_ids
+            agent: _tensor_pool(
+                "randn", (agent, "next_states"), (batch_size, *state_size)
+            )
+            for agent in agent_ids
         }
 
-    return states, actions, rewards, next_states, dones
+    actions = {
+        agent: _tensor_pool("randn", (agent, "actions"), (batch_size, action_size))
+        for agent in agent_ids
+    }
+    rewards = {
+        agent: _tensor_pool("randn", (agent, "rewards"), (batch_size, 1))
+        for agent in agent_ids
+    }
+    dones = {
+        agent: _tensor_pool("randint", (agent, "dones"), (batch_size, 1), 2)
+        for agent in agent_ids
+    }
+
+    experiences = states, actions, rewards, next_states, dones
+    _EXPERIENCES_CACHE[key] = experiences
+    return experiences
 
 
 @pytest.fixture
-def experiences(batch_size, state_dims, action_dims, agent_ids, one_hot, device):
+def experiences(
+    _tensor_pool, batch_size, state_dims, action_dims, agent_ids, one_hot, device
+):
     state_size = state_dims[0]
     action_size = action_dims[0]
+    key = ("device", batch_size, tuple(state_size), action_size, one_hot, device)
+    if key in _EXPERIENCES_CACHE:
+        return _EXPERIENCES_CACHE[key]
     if one_hot:
         states = {
-            agent: torch.randint(0, state_size[0], (batch_size, 1)).float().to(device)
+            agent: _tensor_pool(
+                "randint",
+                (agent, "states"),
+                (batch_size, 1),
+                state_size[0],
+                device=device,
+            ).float()
+            for agent in agent_ids
+        }
+        next_states = {
+            agent: _tensor_pool(
+                "randint",
+                (agent, "next_states"),
+                (batch_size, 1),
+                state_size[0],
+                device=device,
+            ).float()
             for agent in agent_ids
         }
     else:
         states = {
-            agent: torch.randn(batch_size, *state_size).to(device)
+            agent: _tensor_pool(
+                "randn", (agent, "states"), (batch_size, *state_size), device=device
+            )
+            for agent in agent_ids
+        }
+        next_states = {
+            agent: _tensor_pool(
+                "randn",
+                (agent, "next_states"),
+                (batch_size, *state_size),
+                device=device,
+            )
             for agent in agent_ids
         }
 
     actions = {
-        agent: torch.randn(batch_size, action_size).to(device) for agent in agent_ids
+        agent: _tensor_pool(
+            "randn", (agent, "actions"), (batch_size, action_size), device=device
+        )
+        for agent in agent_ids
+    }
+    rewards = {
+        agent: _tensor_pool("randn", (agent, "rewards"), (batch_size, 1), device=device)
+        for agent in agent_ids
     }
-    rewards = {agent: torch.randn(batch_size, 1).to(device) for agent in agent_ids}
     dones = {
-        agent: torch.randint(0, 2, (batch_size, 1)).to(device) for agent in agent_ids
+        agent: _tensor_pool(
+            "randint", (agent, "dones"), (batch_size, 1), 2, device=device
+        )
+        for agent in agent_ids
     }
-    if one_hot:
-        next_states = {
-            agent: torch.randint(0, state_size[0], (batch_size, 1)).float().to(device)
-            for agent in agent_ids
-        }
-    else:
-        next_states = {
-            agent: torch.randn(batch_size, *state_size).to(device)
-            for agent in agent_ids
-        }
 
-    return states, actions, rewards, next_states, dones
+    experiences = states, actions, rewards, next_states, dones
+    _EXPERIENCES_CACHE[key] = experiences
+    return experiences
 
 
 @pytest.mark.parametrize(
@@ -273,7 +762,7 @@ def test_initialize_matd3_with_net_config(
     action_dims = [2, 2]
     one_hot = False
     n_agents = 2
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     max_action = [(1,), (1,)]
     min_action = [(-1,), (-1,)]
     discrete_actions = False
@@ -281,10 +770,11 @@ def test_initialize_matd3_with_net_config(
     batch_size = 64
     policy_freq = 2
     if accelerator_flag:
-        accelerator = Accelerator()
+        accelerator = _shared_accelerator()
     else:
         accelerator = None
-    matd3 = MATD3(
+    matd3 = _get_matd3(
+        ("net_config", net_config["arch"], tuple(state_dims[0]), accelerator_flag),
         state_dims=state_dims,
         net_config=net_config,
         action_dims=action_dims,
@@ -313,8 +803,10 @@ def test_initialize_matd3_with_net_config(
     assert matd3.net_config == net_config, matd3.net_config
     assert matd3.batch_size == batch_size
     assert matd3.multi
-    assert matd3.total_state_dims == sum(state[0] for state in state_dims)
-    assert matd3.total_actions == sum(action_dims)
+    expected_total_state_dims = sum(state[0] for state in state_dims)
+    expected_total_actions = sum(action_dims)
+    assert matd3.total_state_dims == expected_total_state_dims
+    assert matd3.total_actions == expected_total_actions
     assert matd3.scores == []
     assert matd3.fitness == []
     assert matd3.steps == [0]
@@ -326,45 +818,15 @@ def test_initialize_matd3_with_net_config(
     else:
         evo_type = EvolvableCNN
         assert matd3.arch == "cnn"
-    assert all(isinstance(actor, evo_type) for actor in matd3.actors)
-    assert all(isinstance(critic_1, evo_type) for critic_1 in matd3.critics_1)
-    assert all(isinstance(critic_2, evo_type) for critic_2 in matd3.critics_2)
-    assert all(
-        isinstance(actor_target, evo_type) for actor_target in matd3.actor_targets
-    )
-    assert all(
-        isinstance(critic_target_1, evo_type)
-        for critic_target_1 in matd3.critic_targets_1
-    )
-    assert all(
-        isinstance(critic_target_2, evo_type)
-        for critic_target_2 in matd3.critic_targets_2
-    )
+    assert all(isinstance(network, evo_type) for network in _all_networks(matd3))
     if accelerator is None:
         assert all(
-            isinstance(actor_optimizer, optim.Adam)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, optim.Adam)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, optim.Adam)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, optim.Adam) for optimizer in _all_optimizers(matd3)
         )
     else:
         assert all(
-            isinstance(actor_optimizer, AcceleratedOptimizer)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, AcceleratedOptimizer)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, AcceleratedOptimizer)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, AcceleratedOptimizer)
+            for optimizer in _all_optimizers(matd3)
         )
     assert isinstance(matd3.criterion, nn.MSELoss)
 
@@ -380,27 +842,25 @@ def test_initialize_matd3_with_mlp_networks(
     mlp_actor, mlp_critic, state_dims, action_dims, accelerator_flag, device
 ):
     if accelerator_flag:
-        accelerator = Accelerator()
+        accelerator = _shared_accelerator()
     else:
         accelerator = None
-    evo_actors = [
-        MakeEvolvable(network=mlp_actor, input_tensor=torch.randn(1, 6), device=device)
-        for _ in range(2)
-    ]
-    evo_critics_1 = [
-        MakeEvolvable(network=mlp_critic, input_tensor=torch.randn(1, 8), device=device)
-        for _ in range(2)
-    ]
-    evo_critics_2 = [
-        MakeEvolvable(network=mlp_critic, input_tensor=torch.randn(1, 8), device=device)
-        for _ in range(2)
-    ]
+    evo_actor = _make_evolvable(
+        network=mlp_actor, input_tensor=_input_tensor(1, 6), device=device
+    )
+    evo_critic = _make_evolvable(
+        network=mlp_critic, input_tensor=_input_tensor(1, 8), device=device
+    )
+    evo_actors = [evo_actor, copy.deepcopy(evo_actor)]
+    evo_critics_1 = [evo_critic, copy.deepcopy(evo_critic)]
+    evo_critics_2 = [copy.deepcopy(evo_critic) for _ in range(2)]
     evo_critics = [evo_critics_1, evo_critics_2]
-    matd3 = MATD3(
+    matd3 = _get_matd3(
+        ("make_evo_mlp", tuple(state_dims[0]), accelerator_flag),
         state_dims=state_dims,
         action_dims=action_dims,
         one_hot=False,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         n_agents=len(state_dims),
         max_action=[(1,), (1,)],
         min_action=[(-1,), (-1,)],
@@ -411,9 +871,10 @@ def test_initialize_matd3_with_mlp_networks(
         accelerator=accelerator,
         policy_freq=2,
     )
-    assert all(isinstance(actor, MakeEvolvable) for actor in matd3.actors)
-    assert all(isinstance(critic_1, MakeEvolvable) for critic_1 in matd3.critics_1)
-    assert all(isinstance(critic_2, MakeEvolvable) for critic_2 in matd3.critics_2)
+    assert all(
+        isinstance(network, MakeEvolvable)
+        for network in chain(matd3.actors, matd3.critics_1, matd3.critics_2)
+    )
     assert matd3.net_config is None
     assert matd3.arch == "mlp"
     assert matd3.state_dims == state_dims
@@ -426,36 +887,21 @@ def test_initialize_matd3_with_mlp_networks(
     assert matd3.min_action == [(-1,), (-1,)]
     assert matd3.discrete_actions is True
     assert matd3.multi
-    assert matd3.total_state_dims == sum(state[0] for state in state_dims)
-    assert matd3.total_actions == sum(action_dims)
+    expected_total_state_dims = sum(state[0] for state in state_dims)
+    expected_total_actions = sum(action_dims)
+    assert matd3.total_state_dims == expected_total_state_dims
+    assert matd3.total_actions == expected_total_actions
     assert matd3.scores == []
     assert matd3.fitness == []
     assert matd3.steps == [0]
     if accelerator is None:
         assert all(
-            isinstance(actor_optimizer, optim.Adam)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, optim.Adam)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, optim.Adam)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, optim.Adam) for optimizer in _all_optimizers(matd3)
         )
     else:
         assert all(
-            isinstance(actor_optimizer, AcceleratedOptimizer)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, AcceleratedOptimizer)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, AcceleratedOptimizer)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, AcceleratedOptimizer)
+            for optimizer in _all_optimizers(matd3)
         )
     assert isinstance(matd3.criterion, nn.MSELoss)
 
@@ -467,45 +913,35 @@ def test_initialize_matd3_with_mlp_networks(
         ([(4, 210, 160) for _ in range(2)], [2 for _ in range(2)], True),
     ],
 )
+@pytest.mark.slow
 def test_initialize_matd3_with_cnn_networks(
     cnn_actor, cnn_critic, state_dims, action_dims, accelerator_flag, device
 ):
     if accelerator_flag:
-        accelerator = Accelerator()
+        accelerator = _shared_accelerator()
     else:
         accelerator = None
-    evo_actors = [
-        MakeEvolvable(
-            network=cnn_actor,
-            input_tensor=torch.randn(1, 4, 2, 210, 160),
-            device=device,
-        )
-        for _ in range(2)
-    ]
-    evo_critics_1 = [
-        MakeEvolvable(
-            network=cnn_critic,
-            input_tensor=torch.randn(1, 4, 2, 210, 160),
-            secondary_input_tensor=torch.randn(1, 2),
-            device=device,
-        )
-        for _ in range(2)
-    ]
-    evo_critics_2 = [
-        MakeEvolvable(
-            network=cnn_critic,
-            input_tensor=torch.randn(1, 4, 2, 210, 160),
-            secondary_input_tensor=torch.randn(1, 2),
-            device=device,
-        )
-        for _ in range(2)
-    ]
+    evo_actor = _make_evolvable(
+        network=cnn_actor,
+        input_tensor=_input_tensor(1, 4, 2, 210, 160),
+        device=device,
+    )
+    evo_critic = _make_evolvable(
+        network=cnn_critic,
+        input_tensor=_input_tensor(1, 4, 2, 210, 160),
+        secondary_input_tensor=_input_tensor(1, 2),
+        device=device,
+    )
+    evo_actors = [evo_actor, copy.deepcopy(evo_actor)]
+    evo_critics_1 = [evo_critic, copy.deepcopy(evo_critic)]
+    evo_critics_2 = [copy.deepcopy(evo_critic) for _ in range(2)]
     evo_critics = [evo_critics_1, evo_critics_2]
-    matd3 = MATD3(
+    matd3 = _get_matd3(
+        ("make_evo_cnn", tuple(state_dims[0]), accelerator_flag),
         state_dims=state_dims,
         action_dims=action_dims,
         one_hot=False,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         n_agents=len(state_dims),
         max_action=[(1,), (1,)],
         min_action=[(-1,), (-1,)],
@@ -516,9 +952,10 @@ def test_initialize_matd3_with_cnn_networks(
         accelerator=accelerator,
         policy_freq=2,
     )
-    assert all(isinstance(actor, MakeEvolvable) for actor in matd3.actors)
-    assert all(isinstance(critic_1, MakeEvolvable) for critic_1 in matd3.critics_1)
-    assert all(isinstance(critic_2, MakeEvolvable) for critic_2 in matd3.critics_2)
+    assert all(
+        isinstance(network, MakeEvolvable)
+        for network in chain(matd3.actors, matd3.critics_1, matd3.critics_2)
+    )
     assert matd3.net_config is None
     assert matd3.arch == "cnn"
     assert matd3.state_dims == state_dims
@@ -531,36 +968,21 @@ def test_initialize_matd3_with_cnn_networks(
     assert matd3.min_action == [(-1,), (-1,)]
     assert matd3.discrete_actions is True
     assert matd3.multi
-    assert matd3.total_state_dims == sum(state[0] for state in state_dims)
-    assert matd3.total_actions == sum(action_dims)
+    expected_total_state_dims = sum(state[0] for state in state_dims)
+    expected_total_actions = sum(action_dims)
+    assert matd3.total_state_dims == expected_total_state_dims
+    assert matd3.total_actions == expected_total_actions
     assert matd3.scores == []
     assert matd3.fitness == []
     assert matd3.steps == [0]
     if accelerator is None:
         assert all(
-            isinstance(actor_optimizer, optim.Adam)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, optim.Adam)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, optim.Adam)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, optim.Adam) for optimizer in _all_optimizers(matd3)
         )
     else:
         assert all(
-            isinstance(actor_optimizer, AcceleratedOptimizer)
-            for actor_optimizer in matd3.actor_optimizers
-        )
-        assert all(
-            isinstance(critic_1_optimizer, AcceleratedOptimizer)
-            for critic_1_optimizer in matd3.critic_1_optimizers
-        )
-        assert all(
-            isinstance(critic_2_optimizer, AcceleratedOptimizer)
-            for critic_2_optimizer in matd3.critic_2_optimizers
+            isinstance(optimizer, AcceleratedOptimizer)
+            for optimizer in _all_optimizers(matd3)
         )
     assert isinstance(matd3.criterion, nn.MSELoss)
 
@@ -573,69 +995,19 @@ def test_initialize_matd3_with_cnn_networks(
     ],
 )
 def test_initialize_matd3_with_evo_networks(state_dims, action_dims, net, device):
-    if net == "mlp":
-        evo_actors = [
-            EvolvableMLP(
-                num_inputs=state_dims[x][0],
-                num_outputs=action_dims[x],
-                hidden_size=[64, 64],
-                mlp_activation="ReLU",
-                mlp_output_activation="Tanh",
-            )
-            for x in range(2)
-        ]
-        evo_critics = [
-            [
-                EvolvableMLP(
-                    num_inputs=sum(state_dim[0] for state_dim in state_dims)
-                    + sum(action_dims),
-                    num_outputs=1,
-                    hidden_size=[64, 64],
-                    mlp_activation="ReLU",
-                )
-                for x in range(2)
-            ]
-            for _ in range(2)
-        ]
-    else:
-        evo_actors = [
-            EvolvableCNN(
-                input_shape=state_dims[0],
-                num_actions=action_dims[0],
-                channel_size=[8, 8],
-                kernel_size=[2, 2],
-                stride_size=[1, 1],
-                hidden_size=[64, 64],
-                mlp_activation="ReLU",
-                multi=True,
-                n_agents=2,
-                mlp_output_activation="Tanh",
-            )
-            for _ in range(2)
-        ]
-        evo_critics = [
-            [
-                EvolvableCNN(
-                    input_shape=state_dims[0],
-                    num_actions=sum(action_dims),
-                    channel_size=[8, 8],
-                    kernel_size=[2, 2],
-                    stride_size=[1, 1],
-                    hidden_size=[64, 64],
-                    n_agents=2,
-                    critic=True,
-                    multi=True,
-                    mlp_activation="ReLU",
-                )
-                for _ in range(2)
-            ]
-            for _ in range(2)
-        ]
-    matd3 = MATD3(
+    actor_prototype, critic_prototype = _evo_network_prototypes(
+        net, tuple(state_dims[0]), tuple(action_dims)
+    )
+    evo_actors = [copy.deepcopy(actor_prototype) for _ in range(2)]
+    evo_critics = [
+        [copy.deepcopy(critic_prototype) for _ in range(2)] for _ in range(2)
+    ]
+    matd3 = _get_matd3(
+        ("evo_networks", net, tuple(state_dims[0])),
         state_dims=state_dims,
         action_dims=action_dims,
         one_hot=False,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         n_agents=len(state_dims),
         max_action=[(1,), (1,)],
         min_action=[(-1,), (-1,)],
@@ -645,13 +1017,8 @@ def test_initialize_matd3_with_evo_networks(state_dims, action_dims, net, device
         device=device,
     )
     assert all(
-        isinstance(actor, (EvolvableMLP, EvolvableCNN)) for actor in matd3.actors
-    )
-    assert all(
-        isinstance(critic, (EvolvableMLP, EvolvableCNN)) for critic in matd3.critics_1
-    )
-    assert all(
-        isinstance(critic, (EvolvableMLP, EvolvableCNN)) for critic in matd3.critics_2
+        isinstance(network, (EvolvableMLP, EvolvableCNN))
+        for network in chain(matd3.actors, matd3.critics_1, matd3.critics_2)
     )
     if net == "mlp":
         assert matd3.arch == "mlp"
@@ -667,22 +1034,15 @@ def test_initialize_matd3_with_evo_networks(state_dims, action_dims, net, device
     assert matd3.min_action == [(-1,), (-1,)]
     assert matd3.discrete_actions is True
     assert matd3.multi
-    assert matd3.total_state_dims == sum(state[0] for state in state_dims)
-    assert matd3.total_actions == sum(action_dims)
+    expected_total_state_dims = sum(state[0] for state in state_dims)
+    expected_total_actions = sum(action_dims)
+    assert matd3.total_state_dims == expected_total_state_dims
+    assert matd3.total_actions == expected_total_actions
     assert matd3.scores == []
     assert matd3.fitness == []
     assert matd3.steps == [0]
     assert all(
-        isinstance(actor_optimizer, optim.Adam)
-        for actor_optimizer in matd3.actor_optimizers
-    )
-    assert all(
-        isinstance(critic_1_optimizer, optim.Adam)
-        for critic_1_optimizer in matd3.critic_1_optimizers
-    )
-    assert all(
-        isinstance(critic_2_optimizer, optim.Adam)
-        for critic_2_optimizer in matd3.critic_2_optimizers
+        isinstance(optimizer, optim.Adam) for optimizer in _all_optimizers(matd3)
     )
 
     assert isinstance(matd3.criterion, nn.MSELoss)
@@ -703,7 +1063,7 @@ def test_initialize_matd3_with_incorrect_evo_networks(state_dims, action_dims, d
             state_dims=state_dims,
             action_dims=action_dims,
             one_hot=False,
-            agent_ids=["agent_0", "agent_1"],
+            agent_ids=AGENT_IDS,
             n_agents=len(state_dims),
             max_action=[(1,), (1,)],
             min_action=[(-1,), (-1,)],
@@ -722,16 +1082,16 @@ def test_initialize_matd3_with_incorrect_evo_networks(state_dims, action_dims, d
 )
 def test_matd3_init_warning(mlp_actor, state_dims, action_dims, device):
     warning_string = "Actor and critic network lists must both be supplied to use custom networks. Defaulting to net config."
-    evo_actors = [
-        MakeEvolvable(network=mlp_actor, input_tensor=torch.randn(1, 6), device=device)
-        for _ in range(2)
-    ]
+    evo_actor = _make_evolvable(
+        network=mlp_actor, input_tensor=_input_tensor(1, 6), device=device
+    )
+    evo_actors = [evo_actor, copy.deepcopy(evo_actor)]
     with pytest.warns(UserWarning, match=warning_string):
         MATD3(
             state_dims=state_dims,
             action_dims=action_dims,
             one_hot=False,
-            agent_ids=["agent_0", "agent_1"],
+            agent_ids=AGENT_IDS,
             n_agents=len(state_dims),
             max_action=[(1,), (1,)],
             min_action=[(-1,), (-1,)],
@@ -742,19 +1102,44 @@ def test_matd3_init_warning(mlp_actor, state_dims, action_dims, device):
 
 
 @pytest.mark.parametrize(
-    "mode", (None, 0, False, "default", "reduce-overhead", "max-autotune")
+    "mode",
+    (
+        None,
+        0,
+        False,
+        pytest.param("default", marks=pytest.mark.compile),
+        pytest.param(
+            "reduce-overhead",
+            marks=[
+                pytest.mark.compile,
+                pytest.mark.skipif(
+                    not _HAS_CUDA, reason="reduce-overhead targets cudagraphs"
+                ),
+            ],
+        ),
+        pytest.param(
+            "max-autotune",
+            marks=[
+                pytest.mark.compile,
+                pytest.mark.skipif(
+                    not _HAS_CUDA, reason="max-autotune targets cudagraphs"
+                ),
+            ],
+        ),
+    ),
 )
 def test_matd3_init_torch_compiler_no_error(mode):
-    matd3 = MATD3(
+    matd3 = _get_matd3(
+        ("torch_compiler", repr(mode)),
         state_dims=[(1,), (1,)],
         action_dims=[1, 1],
         one_hot=False,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         n_agents=2,
         max_action=[(1,), (1,)],
         min_action=[(-1,), (-1,)],
         discrete_actions=False,
-        device="cuda" if torch.cuda.is_available() else "cpu",
+        device="cuda" if _HAS_CUDA else "cpu",
         torch_compiler=mode,
     )
     if isinstance(mode, str):
@@ -798,12 +1183,12 @@ def test_matd3_init_torch_compiler_error(mode):
             state_dims=[(1,), (1,)],
             action_dims=[1, 1],
             one_hot=False,
-            agent_ids=["agent_0", "agent_1"],
+            agent_ids=AGENT_IDS,
             n_agents=2,
             max_action=[(1,), (1,)],
             min_action=[(-1,), (-1,)],
             discrete_actions=False,
-            device="cuda" if torch.cuda.is_available() else "cpu",
+            device="cuda" if _HAS_CUDA else "cpu",
             torch_compiler=mode,
         )
 
@@ -824,21 +1209,13 @@ def test_matd3_init_torch_compiler_error(mode):
 def test_matd3_get_action_mlp(
     training, state_dims, action_dims, discrete_actions, one_hot, device
 ):
-    agent_ids = ["agent_0", "agent_1"]
-    if one_hot:
-        state = {
-            agent: np.random.randint(0, state_dims[idx], 1)
-            for idx, agent in enumerate(agent_ids)
-        }
-    else:
-        state = {
-            agent: np.random.randn(*state_dims[idx])
-            for idx, agent in enumerate(agent_ids)
-        }
+    agent_ids = AGENT_IDS
+    state = _random_state(agent_ids, state_dims, one_hot)
 
-    matd3 = MATD3(
-        state_dims,
-        action_dims,
+    matd3 = _get_matd3(
+        ("get_action_mlp", one_hot, discrete_actions),
+        state_dims=state_dims,
+        action_dims=action_dims,
         one_hot=one_hot,
         net_config={"arch": "mlp", "hidden_size": [8, 8]},
         n_agents=2,
@@ -848,33 +1225,9 @@ def test_matd3_get_action_mlp(
         discrete_actions=discrete_actions,
         device=device,
     )
-    cont_actions, discrete_action = matd3.get_action(state, training)
-    for idx, env_actions in enumerate(list(cont_actions.values())):
-        for action in env_actions:
-            assert len(action) == action_dims[idx]
-            if discrete_actions:
-                assert (
-                    np.isclose(
-                        sum(action),
-                        1.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                    or np.isclose(
-                        sum(action),
-                        0.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                )
-            act = action[idx]
-            assert act.dtype == np.float32
-            assert -1 <= act.all() <= 1
-
-    if discrete_actions:
-        for idx, env_action in enumerate(list(discrete_action.values())):
-            for action in env_action:
-                assert action <= action_dims[idx] - 1
+    with torch.inference_mode():
+        cont_actions, discrete_action = matd3.get_action(state, training)
+    _assert_valid_actions(cont_actions, discrete_action, action_dims, discrete_actions)
     matd3 = None
 
 
@@ -887,10 +1240,11 @@ def test_matd3_get_action_mlp(
         (0, [(3, 32, 32) for _ in range(2)], [2 for _ in range(2)], True),
     ],
 )
+@pytest.mark.slow
 def test_matd3_get_action_cnn(
     training, state_dims, action_dims, discrete_actions, device
 ):
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     net_config = {
         "arch": "cnn",
         "hidden_size": [64, 64],
@@ -899,12 +1253,11 @@ def test_matd3_get_action_cnn(
         "stride_size": [1],
         "normalize": False,
     }
-    state = {
-        agent: np.random.randn(*state_dims[idx]) for idx, agent in enumerate(agent_ids)
-    }
-    matd3 = MATD3(
-        state_dims,
-        action_dims,
+    state = _random_state(agent_ids, state_dims)
+    matd3 = _get_matd3(
+        ("get_action_cnn", discrete_actions),
+        state_dims=state_dims,
+        action_dims=action_dims,
         one_hot=False,
         n_agents=2,
         agent_ids=agent_ids,
@@ -914,33 +1267,9 @@ def test_matd3_get_action_cnn(
         discrete_actions=discrete_actions,
         device=device,
     )
-    cont_actions, discrete_action = matd3.get_action(state, training)
-    for idx, env_actions in enumerate(list(cont_actions.values())):
-        for action in env_actions:
-            assert len(action) == action_dims[idx]
-            if discrete_actions:
-                assert (
-                    np.isclose(
-                        sum(action),
-                        1.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                    or np.isclose(
-                        sum(action),
-                        0.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                )
-            act = action[idx]
-            assert act.dtype == np.float32
-            assert -1 <= act.all() <= 1
-
-    if discrete_actions:
-        for idx, env_action in enumerate(list(discrete_action.values())):
-            for action in env_action:
-                assert action <= action_dims[idx] - 1
+    with torch.inference_mode():
+        cont_actions, discrete_action = matd3.get_action(state, training)
+    _assert_valid_actions(cont_actions, discrete_action, action_dims, discrete_actions)
 
 
 @pytest.mark.parametrize(
@@ -955,11 +1284,9 @@ def test_matd3_get_action_cnn(
 def test_matd3_get_action_distributed(
     training, state_dims, action_dims, discrete_actions
 ):
-    accelerator = Accelerator()
-    agent_ids = ["agent_0", "agent_1"]
-    state = {
-        agent: np.random.randn(*state_dims[idx]) for idx, agent in enumerate(agent_ids)
-    }
+    accelerator = _shared_accelerator()
+    agent_ids = AGENT_IDS
+    state = _random_state(agent_ids, state_dims)
     matd3 = MATD3(
         state_dims,
         action_dims,
@@ -972,43 +1299,19 @@ def test_matd3_get_action_distributed(
         accelerator=accelerator,
     )
     new_actors = [
-        DummyEvolvableMLP(
-            num_inputs=actor.num_inputs,
-            num_outputs=actor.num_outputs,
-            hidden_size=actor.hidden_size,
-            device=actor.device,
-            mlp_output_activation=actor.mlp_output_activation,
+        _get_dummy_mlp(
+            actor.num_inputs,
+            actor.num_outputs,
+            actor.hidden_size,
+            actor.device,
+            actor.mlp_output_activation,
         )
         for actor in matd3.actors
     ]
     matd3.actors = new_actors
-    cont_actions, discrete_action = matd3.get_action(state, training)
-    for idx, env_actions in enumerate(list(cont_actions.values())):
-        for action in env_actions:
-            assert len(action) == action_dims[idx]
-            if discrete_actions:
-                assert (
-                    np.isclose(
-                        sum(action),
-                        1.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                    or np.isclose(
-                        sum(action),
-                        0.0,
-                        atol=0.1,
-                        rtol=1e-3,
-                    ).all()
-                )
-            act = action[idx]
-            assert act.dtype == np.float32
-            assert -1 <= act.all() <= 1
-
-    if discrete_actions:
-        for idx, env_action in enumerate(list(discrete_action.values())):
-            for action in env_action:
-                assert action <= action_dims[idx] - 1
+    with torch.inference_mode():
+        cont_actions, discrete_action = matd3.get_action(state, training)
+    _assert_valid_actions(cont_actions, discrete_action, action_dims, discrete_actions)
 
 
 @pytest.mark.parametrize(
@@ -1023,18 +1326,17 @@ def test_matd3_get_action_distributed(
 def test_matd3_get_action_agent_masking(
     training, state_dims, action_dims, discrete_actions, device
 ):
-    agent_ids = ["agent_0", "agent_1"]
-    state = {
-        agent: np.random.randn(*state_dims[idx]) for idx, agent in enumerate(agent_ids)
-    }
+    agent_ids = AGENT_IDS
+    state = _random_state(agent_ids, state_dims)
     agent_mask = {"agent_0": False, "agent_1": True}
     if discrete_actions:
         env_defined_actions = {"agent_0": 1, "agent_1": None}
     else:
         env_defined_actions = {"agent_0": np.array([0, 1]), "agent_1": None}
-    matd3 = MATD3(
-        state_dims,
-        action_dims,
+    matd3 = _get_matd3(
+        ("get_action_masking", discrete_actions),
+        state_dims=state_dims,
+        action_dims=action_dims,
         one_hot=False,
         n_agents=2,
         agent_ids=agent_ids,
@@ -1043,9 +1345,13 @@ def test_matd3_get_action_agent_masking(
         discrete_actions=discrete_actions,
         device=device,
     )
-    cont_actions, discrete_action = matd3.get_action(
-        state, training, agent_mask=agent_mask, env_defined_actions=env_defined_actions
-    )
+    with torch.inference_mode():
+        cont_actions, discrete_action = matd3.get_action(
+            state,
+            training,
+            agent_mask=agent_mask,
+            env_defined_actions=env_defined_actions,
+        )
     if discrete_actions:
         assert np.array_equal(discrete_action["agent_0"], 1), discrete_action["agent_0"]
     assert np.array_equal(cont_actions["agent_0"], np.array([0, 1])), cont_actions[
@@ -1056,10 +1362,10 @@ def test_matd3_get_action_agent_masking(
 @pytest.mark.parametrize(
     "state_dims, discrete_actions, batch_size, action_dims, agent_ids, one_hot",
     [
-        ([(6,), (6,)], False, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(6,), (6,)], False, 64, [2, 2], ["agent_0", "agent_1"], True),
-        ([(6,), (6,)], True, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(6,), (6,)], True, 64, [2, 2], ["agent_0", "agent_1"], True),
+        ([(6,), (6,)], False, 64, [2, 2], AGENT_IDS, False),
+        ([(6,), (6,)], False, 64, [2, 2], AGENT_IDS, True),
+        ([(6,), (6,)], True, 64, [2, 2], AGENT_IDS, False),
+        ([(6,), (6,)], True, 64, [2, 2], AGENT_IDS, True),
     ],
 )
 def test_matd3_learns_from_experiences_mlp(
@@ -1073,7 +1379,7 @@ def test_matd3_learns_from_experiences_mlp(
     device,
 ):
     action_dims = [2, 2]
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     policy_freq = 2
     matd3 = MATD3(
         state_dims,
@@ -1089,20 +1395,17 @@ def test_matd3_learns_from_experiences_mlp(
     )
     actors = matd3.actors
     actor_targets = matd3.actor_targets
-    actors_pre_learn_sd = [copy.deepcopy(actor.state_dict()) for actor in matd3.actors]
+    actors_pre_learn_sd = _state_dict_snapshots(matd3.actors)
     critics_1 = matd3.critics_1
     critic_targets_1 = matd3.critic_targets_1
     critics_2 = matd3.critics_2
     critic_targets_2 = matd3.critic_targets_2
-    critics_1_pre_learn_sd = [
-        str(copy.deepcopy(critic_1.state_dict())) for critic_1 in matd3.critics_1
-    ]
-    critics_2_pre_learn_sd = [
-        str(copy.deepcopy(critic_2.state_dict())) for critic_2 in matd3.critics_2
-    ]
+    critics_1_pre_learn_sd = _state_dict_snapshots(matd3.critics_1)
+    critics_2_pre_learn_sd = _state_dict_snapshots(matd3.critics_2)
 
-    for _ in range(4 * policy_freq):
-        matd3.scores.append(0)
+    n_steps = 4 * policy_freq
+    matd3.scores = [0] * n_steps
+    for _ in range(n_steps):
         loss = matd3.learn(experiences)
 
     assert isinstance(loss, dict)
@@ -1115,7 +1418,7 @@ def test_matd3_learns_from_experiences_mlp(
     ):
         assert old_actor_target == updated_actor_target
     for old_actor_state_dict, updated_actor in zip(actors_pre_learn_sd, matd3.actors):
-        assert old_actor_state_dict != str(updated_actor.state_dict())
+        assert old_actor_state_dict != _state_dict_bytes(updated_actor)
     for old_critic_1, updated_critic_1 in zip(critics_1, matd3.critics_1):
         assert old_critic_1 == updated_critic_1
     for old_critic_target_1, updated_critic_target_1 in zip(
@@ -1125,7 +1428,7 @@ def test_matd3_learns_from_experiences_mlp(
     for old_critic_1_state_dict, updated_critic_1 in zip(
         critics_1_pre_learn_sd, matd3.critics_1
     ):
-        assert old_critic_1_state_dict != str(updated_critic_1.state_dict())
+        assert old_critic_1_state_dict != _state_dict_bytes(updated_critic_1)
     for old_critic_2, updated_critic_2 in zip(critics_2, matd3.critics_2):
         assert old_critic_2 == updated_critic_2
     for old_critic_target_2, updated_critic_target_2 in zip(
@@ -1135,7 +1438,7 @@ def test_matd3_learns_from_experiences_mlp(
     for old_critic_2_state_dict, updated_critic_2 in zip(
         critics_2_pre_learn_sd, matd3.critics_2
     ):
-        assert old_critic_2_state_dict != str(updated_critic_2.state_dict())
+        assert old_critic_2_state_dict != _state_dict_bytes(updated_critic_2)
 
 
 def no_sync(self):
@@ -1152,10 +1455,10 @@ def no_sync(self):
 @pytest.mark.parametrize(
     "state_dims, discrete_actions, batch_size, action_dims, agent_ids, one_hot",
     [
-        ([(6,), (6,)], False, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(6,), (6,)], False, 64, [2, 2], ["agent_0", "agent_1"], True),
-        ([(6,), (6,)], True, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(6,), (6,)], True, 64, [2, 2], ["agent_0", "agent_1"], True),
+        ([(6,), (6,)], False, 64, [2, 2], AGENT_IDS, False),
+        ([(6,), (6,)], False, 64, [2, 2], AGENT_IDS, True),
+        ([(6,), (6,)], True, 64, [2, 2], AGENT_IDS, False),
+        ([(6,), (6,)], True, 64, [2, 2], AGENT_IDS, True),
     ],
 )
 def test_matd3_learns_from_experiences_mlp_distributed(
@@ -1166,10 +1469,14 @@ def test_matd3_learns_from_experiences_mlp_distributed(
     action_dims,
     agent_ids,
     one_hot,
+    monkeypatch,
 ):
-    accelerator = Accelerator(device_placement=False)
+    # Patch no_sync once at class level rather than binding it onto each of
+    # the twelve network instances.
+    monkeypatch.setattr(EvolvableMLP, "no_sync", no_sync, raising=False)
+    accelerator = _shared_accelerator(device_placement=False)
     action_dims = [2, 2]
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     policy_freq = 2
     matd3 = MATD3(
         state_dims,
@@ -1184,44 +1491,19 @@ def test_matd3_learns_from_experiences_mlp_distributed(
         policy_freq=policy_freq,
     )
 
-    for (
-        actor,
-        critic_1,
-        critic_2,
-        actor_target,
-        critic_target_1,
-        critic_target_2,
-    ) in zip(
-        matd3.actors,
-        matd3.critics_1,
-        matd3.critics_2,
-        matd3.actor_targets,
-        matd3.critic_targets_1,
-        matd3.critic_targets_2,
-    ):
-        actor.no_sync = no_sync.__get__(actor)
-        critic_1.no_sync = no_sync.__get__(critic_1)
-        critic_2.no_sync = no_sync.__get__(critic_2)
-        actor_target.no_sync = no_sync.__get__(actor_target)
-        critic_target_1.no_sync = no_sync.__get__(critic_target_1)
-        critic_target_2.no_sync = no_sync.__get__(critic_target_2)
-
     actors = matd3.actors
     actor_targets = matd3.actor_targets
-    actors_pre_learn_sd = [copy.deepcopy(actor.state_dict()) for actor in matd3.actors]
+    actors_pre_learn_sd = _state_dict_snapshots(matd3.actors)
     critics_1 = matd3.critics_1
     critic_targets_1 = matd3.critic_targets_1
     critics_2 = matd3.critics_2
     critic_targets_2 = matd3.critic_targets_2
-    critics_1_pre_learn_sd = [
-        str(copy.deepcopy(critic_1.state_dict())) for critic_1 in matd3.critics_1
-    ]
-    critics_2_pre_learn_sd = [
-        str(copy.deepcopy(critic_2.state_dict())) for critic_2 in matd3.critics_2
-    ]
+    critics_1_pre_learn_sd = _state_dict_snapshots(matd3.critics_1)
+    critics_2_pre_learn_sd = _state_dict_snapshots(matd3.critics_2)
 
-    for _ in range(4 * policy_freq):
-        matd3.scores.append(0)
+    n_steps = 4 * policy_freq
+    matd3.scores = [0] * n_steps
+    for _ in range(n_steps):
         loss = matd3.learn(accelerated_experiences)
 
     assert isinstance(loss, dict)
@@ -1234,7 +1516,7 @@ def test_matd3_learns_from_experiences_mlp_distributed(
     ):
         assert old_actor_target == updated_actor_target
     for old_actor_state_dict, updated_actor in zip(actors_pre_learn_sd, matd3.actors):
-        assert old_actor_state_dict != str(updated_actor.state_dict())
+        assert old_actor_state_dict != _state_dict_bytes(updated_actor)
     for old_critic_1, updated_critic_1 in zip(critics_1, matd3.critics_1):
         assert old_critic_1 == updated_critic_1
     for old_critic_target_1, updated_critic_target_1 in zip(
@@ -1244,7 +1526,7 @@ def test_matd3_learns_from_experiences_mlp_distributed(
     for old_critic_1_state_dict, updated_critic_1 in zip(
         critics_1_pre_learn_sd, matd3.critics_1
     ):
-        assert old_critic_1_state_dict != str(updated_critic_1.state_dict())
+        assert old_critic_1_state_dict != _state_dict_bytes(updated_critic_1)
     for old_critic_2, updated_critic_2 in zip(critics_2, matd3.critics_2):
         assert old_critic_2 == updated_critic_2
     for old_critic_target_2, updated_critic_target_2 in zip(
@@ -1254,17 +1536,18 @@ def test_matd3_learns_from_experiences_mlp_distributed(
     for old_critic_2_state_dict, updated_critic_2 in zip(
         critics_2_pre_learn_sd, matd3.critics_2
     ):
-        assert old_critic_2_state_dict != str(updated_critic_2.state_dict())
+        assert old_critic_2_state_dict != _state_dict_bytes(updated_critic_2)
 
 
 #### NOT WORKING
 @pytest.mark.parametrize(
     "state_dims, discrete_actions, batch_size, action_dims, agent_ids, one_hot",
     [
-        ([(3, 32, 32), (3, 32, 32)], False, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(3, 32, 32), (3, 32, 32)], True, 64, [2, 2], ["agent_0", "agent_1"], False),
+        ([(3, 32, 32), (3, 32, 32)], False, 64, [2, 2], AGENT_IDS, False),
+        ([(3, 32, 32), (3, 32, 32)], True, 64, [2, 2], AGENT_IDS, False),
     ],
 )
+@pytest.mark.slow
 def test_matd3_learns_from_experiences_cnn(
     state_dims,
     experiences,
@@ -1276,7 +1559,7 @@ def test_matd3_learns_from_experiences_cnn(
     device,
 ):
     action_dims = [2, 2]
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     policy_freq = 2
     net_config = {
         "arch": "cnn",
@@ -1301,20 +1584,17 @@ def test_matd3_learns_from_experiences_cnn(
     )
     actors = matd3.actors
     actor_targets = matd3.actor_targets
-    actors_pre_learn_sd = [copy.deepcopy(actor.state_dict()) for actor in matd3.actors]
+    actors_pre_learn_sd = _state_dict_snapshots(matd3.actors)
     critics_1 = matd3.critics_1
     critic_targets_1 = matd3.critic_targets_1
     critics_2 = matd3.critics_2
     critic_targets_2 = matd3.critic_targets_2
-    critics_1_pre_learn_sd = [
-        str(copy.deepcopy(critic_1.state_dict())) for critic_1 in matd3.critics_1
-    ]
-    critics_2_pre_learn_sd = [
-        str(copy.deepcopy(critic_2.state_dict())) for critic_2 in matd3.critics_2
-    ]
+    critics_1_pre_learn_sd = _state_dict_snapshots(matd3.critics_1)
+    critics_2_pre_learn_sd = _state_dict_snapshots(matd3.critics_2)
 
-    for _ in range(100 * policy_freq):
-        matd3.scores.append(0)
+    n_steps = 100 * policy_freq
+    matd3.scores = [0] * n_steps
+    for _ in range(n_steps):
         loss = matd3.learn(experiences)
 
     assert isinstance(loss, dict)
@@ -1327,7 +1607,7 @@ def test_matd3_learns_from_experiences_cnn(
     ):
         assert old_actor_target == updated_actor_target
     for old_actor_state_dict, updated_actor in zip(actors_pre_learn_sd, matd3.actors):
-        assert old_actor_state_dict != str(updated_actor.state_dict())
+        assert old_actor_state_dict != _state_dict_bytes(updated_actor)
     for old_critic_1, updated_critic_1 in zip(critics_1, matd3.critics_1):
         assert old_critic_1 == updated_critic_1
     for old_critic_target_1, updated_critic_target_1 in zip(
@@ -1337,7 +1617,7 @@ def test_matd3_learns_from_experiences_cnn(
     for old_critic_1_state_dict, updated_critic_1 in zip(
         critics_1_pre_learn_sd, matd3.critics_1
     ):
-        assert old_critic_1_state_dict != str(updated_critic_1.state_dict())
+        assert old_critic_1_state_dict != _state_dict_bytes(updated_critic_1)
     for old_critic_2, updated_critic_2 in zip(critics_2, matd3.critics_2):
         assert old_critic_2 == updated_critic_2
     for old_critic_target_2, updated_critic_target_2 in zip(
@@ -1347,7 +1627,7 @@ def test_matd3_learns_from_experiences_cnn(
     for old_critic_2_state_dict, updated_critic_2 in zip(
         critics_2_pre_learn_sd, matd3.critics_2
     ):
-        assert old_critic_2_state_dict != str(updated_critic_2.state_dict())
+        assert old_critic_2_state_dict != _state_dict_bytes(updated_critic_2)
 
 
 # @pytest.mark.skip
@@ -1355,10 +1635,11 @@ def test_matd3_learns_from_experiences_cnn(
 @pytest.mark.parametrize(
     "state_dims, discrete_actions, batch_size, action_dims, agent_ids, one_hot",
     [
-        ([(3, 32, 32), (3, 32, 32)], False, 64, [2, 2], ["agent_0", "agent_1"], False),
-        ([(3, 32, 32), (3, 32, 32)], True, 64, [2, 2], ["agent_0", "agent_1"], False),
+        ([(3, 32, 32), (3, 32, 32)], False, 64, [2, 2], AGENT_IDS, False),
+        ([(3, 32, 32), (3, 32, 32)], True, 64, [2, 2], AGENT_IDS, False),
     ],
 )
+@pytest.mark.slow
 def test_matd3_learns_from_experiences_cnn_distributed(
     state_dims,
     accelerated_experiences,
@@ -1368,10 +1649,12 @@ def test_matd3_learns_from_experiences_cnn_distributed(
     agent_ids,
     one_hot,
     device,
+    monkeypatch,
 ):
-    accelerator = Accelerator(device_placement=False)
+    monkeypatch.setattr(EvolvableCNN, "no_sync", no_sync, raising=False)
+    accelerator = _shared_accelerator(device_placement=False)
     action_dims = [2, 2]
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     net_config = {
         "arch": "cnn",
         "hidden_size": [8],
@@ -1386,53 +1669,28 @@ def test_matd3_learns_from_experiences_cnn_distributed(
         action_dims,
         one_hot=one_hot,
         n_agents=2,
-        net_config=net_config,
-        agent_ids=agent_ids,
-        max_action=[[1], [1]],
-        min_action=[[-1], [-1]],
-        discrete_actions=discrete_actions,
-        accelerator=accelerator,
-        policy_freq=policy_freq,
-    )
-
-    for (
-        actor,
-        critic_1,
-        critic_2,
-        actor_target,
-        critic_target_1,
-        critic_target_2,
-    ) in zip(
-        matd3.actors,
-        matd3.critics_1,
-        matd3.critics_2,
-        matd3.actor_targets,
-        matd3.critic_targets_1,
-        matd3.critic_targets_2,
-    ):
-        actor.no_sync = no_sync.__get__(actor)
-        critic_1.no_sync = no_sync.__get__(critic_1)
-        critic_2.no_sync = no_sync.__get__(critic_2)
-        actor_target.no_sync = no_sync.__get__(actor_target)
-        critic_target_1.no_sync = no_sync.__get__(critic_target_1)
-        critic_target_2.no_sync = no_sync.__get__(critic_target_2)
+        net_config=net_config,
+        agent_ids=agent_ids,
+        max_action=[[1], [1]],
+        min_action=[[-1], [-1]],
+        discrete_actions=discrete_actions,
+        accelerator=accelerator,
+        policy_freq=policy_freq,
+    )
 
     actors = matd3.actors
     actor_targets = matd3.actor_targets
-    actors_pre_learn_sd = [copy.deepcopy(actor.state_dict()) for actor in matd3.actors]
+    actors_pre_learn_sd = _state_dict_snapshots(matd3.actors)
     critics_1 = matd3.critics_1
     critic_targets_1 = matd3.critic_targets_1
-    critics_1_pre_learn_sd = [
-        str(copy.deepcopy(critic_1.state_dict())) for critic_1 in matd3.critics_1
-    ]
+    critics_1_pre_learn_sd = _state_dict_snapshots(matd3.critics_1)
     critics_2 = matd3.critics_2
     critic_targets_2 = matd3.critic_targets_2
-    critics_2_pre_learn_sd = [
-        str(copy.deepcopy(critic_2.state_dict())) for critic_2 in matd3.critics_2
-    ]
+    critics_2_pre_learn_sd = _state_dict_snapshots(matd3.critics_2)
 
-    for _ in range(4):
-        matd3.scores.append(0)
+    n_steps = 4
+    matd3.scores = [0] * n_steps
+    for _ in range(n_steps):
         loss = matd3.learn(accelerated_experiences)
 
     assert isinstance(loss, dict)
@@ -1445,7 +1703,7 @@ def test_matd3_learns_from_experiences_cnn_distributed(
     ):
         assert old_actor_target == updated_actor_target
     for old_actor_state_dict, updated_actor in zip(actors_pre_learn_sd, matd3.actors):
-        assert old_actor_state_dict != str(updated_actor.state_dict())
+        assert old_actor_state_dict != _state_dict_bytes(updated_actor)
 
     for old_critic_1, updated_critic_1 in zip(critics_1, matd3.critics_1):
         assert old_critic_1 == updated_critic_1
@@ -1456,7 +1714,7 @@ def test_matd3_learns_from_experiences_cnn_distributed(
     for old_critic_1_state_dict, updated_critic_1 in zip(
         critics_1_pre_learn_sd, matd3.critics_1
     ):
-        assert old_critic_1_state_dict != str(updated_critic_1.state_dict())
+        assert old_critic_1_state_dict != _state_dict_bytes(updated_critic_1)
 
     for old_critic_2, updated_critic_2 in zip(critics_2, matd3.critics_2):
         assert old_critic_2 == updated_critic_2
@@ -1467,26 +1725,13 @@ def test_matd3_learns_from_experiences_cnn_distributed(
     for old_critic_2_state_dict, updated_critic_2 in zip(
         critics_2_pre_learn_sd, matd3.critics_2
     ):
-        assert old_critic_2_state_dict != str(updated_critic_2.state_dict())
+        assert old_critic_2_state_dict != _state_dict_bytes(updated_critic_2)
 
 
-def test_matd3_soft_update(device):
-    state_dims = [(6,), (6,)]
-    action_dims = [2, 2]
-    accelerator = None
-
-    matd3 = MATD3(
-        state_dims,
-        action_dims,
-        one_hot=False,
-        n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
-        max_action=[[1], [1]],
-        min_action=[[-1], [-1]],
-        discrete_actions=False,
-        accelerator=accelerator,
-        device=device,
-    )
+def test_matd3_soft_update(matd3_mlp_agent):
+    # Soft updates mutate the target networks, so work on a private copy of
+    # the shared agent.
+    matd3 = copy.deepcopy(matd3_mlp_agent)
 
     for (
         actor,
@@ -1503,68 +1748,42 @@ def test_matd3_soft_update(device):
         matd3.critics_2,
         matd3.critic_targets_2,
     ):
-        # Check actors
-        matd3.soft_update(actor, actor_target)
-        eval_params = list(actor.parameters())
-        target_params = list(actor_target.parameters())
-        expected_params = [
-            matd3.tau * eval_param + (1.0 - matd3.tau) * target_param
-            for eval_param, target_param in zip(eval_params, target_params)
-        ]
-        assert all(
-            torch.allclose(expected_param, target_param)
-            for expected_param, target_param in zip(expected_params, target_params)
-        )
-        matd3.soft_update(critic_1, critic_target_1)
-        eval_params = list(critic_1.parameters())
-        target_params = list(critic_target_1.parameters())
-        expected_params = [
-            matd3.tau * eval_param + (1.0 - matd3.tau) * target_param
-            for eval_param, target_param in zip(eval_params, target_params)
-        ]
-
-        assert all(
-            torch.allclose(expected_param, target_param)
-            for expected_param, target_param in zip(expected_params, target_params)
-        )
-        matd3.soft_update(critic_2, critic_target_2)
-        eval_params = list(critic_2.parameters())
-        target_params = list(critic_target_2.parameters())
-        expected_params = [
-            matd3.tau * eval_param + (1.0 - matd3.tau) * target_param
-            for eval_param, target_param in zip(eval_params, target_params)
-        ]
-
-        assert all(
-            torch.allclose(expected_param, target_param)
-            for expected_param, target_param in zip(expected_params, target_params)
-        )
+        for net, target in (
+            (actor, actor_target),
+            (critic_1, critic_target_1),
+            (critic_2, critic_target_2),
+        ):
+            matd3.soft_update(net, target)
+            expected = torch.cat(
+                [
+                    (
+                        matd3.tau * eval_param + (1.0 - matd3.tau) * target_param
+                    ).flatten()
+                    for eval_param, target_param in zip(
+                        net.parameters(), target.parameters()
+                    )
+                ]
+            )
+            updated = torch.cat([param.flatten() for param in target.parameters()])
+            torch.testing.assert_close(updated, expected)
 
 
-def test_matd3_algorithm_test_loop(device):
-    state_dims = [(6,), (6,)]
+def test_matd3_algorithm_test_loop(matd3_mlp_agent):
+    state_dims = MLP_STATE_DIMS
     action_dims = [2, 2]
-    accelerator = None
 
     env = DummyMultiEnv(state_dims[0], action_dims)
 
     # env = make_vect_envs("CartPole-v1", num_envs=num_envs)
-    matd3 = MATD3(
-        state_dims,
-        action_dims,
-        one_hot=False,
-        n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
-        max_action=[[1], [1]],
-        min_action=[[-1], [-1]],
-        discrete_actions=True,
-        accelerator=accelerator,
-        device=device,
-    )
-    mean_score = matd3.test(env, max_steps=10)
+    matd3 = matd3_mlp_agent
+    with torch.inference_mode():
+        mean_score = matd3.test(env, max_steps=10)
+    # test() appends to fitness; undo it so the shared agent stays pristine
+    matd3.fitness.pop()
     assert isinstance(mean_score, float)
 
 
+@pytest.mark.slow
 def test_matd3_algorithm_test_loop_cnn(device):
     env_state_dims = [(32, 32, 3), (32, 32, 3)]
     agent_state_dims = [(3, 32, 32), (3, 32, 32)]
@@ -1579,12 +1798,13 @@ def test_matd3_algorithm_test_loop_cnn(device):
     action_dims = [2, 2]
     accelerator = None
     env = DummyMultiEnv(env_state_dims[0], action_dims)
-    matd3 = MATD3(
-        agent_state_dims,
-        action_dims,
+    matd3 = _get_matd3(
+        ("test_loop_cnn",),
+        state_dims=agent_state_dims,
+        action_dims=action_dims,
         one_hot=False,
         n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         max_action=[[1], [1]],
         min_action=[[-1], [-1]],
         net_config=net_config,
@@ -1592,10 +1812,14 @@ def test_matd3_algorithm_test_loop_cnn(device):
         accelerator=accelerator,
         device=device,
     )
-    mean_score = matd3.test(env, max_steps=10, swap_channels=True)
+    with torch.inference_mode():
+        mean_score = matd3.test(env, max_steps=10, swap_channels=True)
+    # test() appends to fitness; undo it so the shared agent stays pristine
+    matd3.fitness.pop()
     assert isinstance(mean_score, float)
 
 
+@pytest.mark.slow
 def test_matd3_algorithm_test_loop_cnn_vectorized(device):
     env_state_dims = [(32, 32, 3), (32, 32, 3)]
     agent_state_dims = [(3, 32, 32), (3, 32, 32)]
@@ -1610,12 +1834,13 @@ def test_matd3_algorithm_test_loop_cnn_vectorized(device):
     action_dims = [2, 2]
     accelerator = None
     env = make_multi_agent_vect_envs(DummyMultiEnv(env_state_dims[0], action_dims), 2)
-    matd3 = MATD3(
-        agent_state_dims,
-        action_dims,
+    matd3 = _get_matd3(
+        ("test_loop_cnn",),
+        state_dims=agent_state_dims,
+        action_dims=action_dims,
         one_hot=False,
         n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         max_action=[[1], [1]],
         min_action=[[-1], [-1]],
         net_config=net_config,
@@ -1623,7 +1848,10 @@ def test_matd3_algorithm_test_loop_cnn_vectorized(device):
         accelerator=accelerator,
         device=device,
     )
-    mean_score = matd3.test(env, max_steps=10, swap_channels=True)
+    with torch.inference_mode():
+        mean_score = matd3.test(env, max_steps=10, swap_channels=True)
+    # test() appends to fitness; undo it so the shared agent stays pristine
+    matd3.fitness.pop()
     assert isinstance(mean_score, float)
 
 
@@ -1636,7 +1864,7 @@ def test_matd3_clone_returns_identical_agent(accelerator_flag, wrap):
     action_dims = [2, 2]
     one_hot = False
     n_agents = 2
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     max_action = [(1,), (1,)]
     min_action = [(-1,), (-1,)]
     expl_noise = 0.1
@@ -1655,7 +1883,7 @@ def test_matd3_clone_returns_identical_agent(accelerator_flag, wrap):
     policy_freq = 2
     device = "cpu"
     if accelerator_flag:
-        accelerator = Accelerator(device_placement=False)
+        accelerator = _shared_accelerator(device_placement=False)
     else:
         accelerator = None
 
@@ -1689,49 +1917,25 @@ def test_matd3_clone_returns_identical_agent(accelerator_flag, wrap):
     clone_agent = matd3.clone(wrap=wrap)
 
     assert isinstance(clone_agent, MATD3)
-    assert clone_agent.state_dims == matd3.state_dims
-    assert clone_agent.action_dims == matd3.action_dims
-    assert clone_agent.one_hot == matd3.one_hot
-    assert clone_agent.n_agents == matd3.n_agents
-    assert clone_agent.agent_ids == matd3.agent_ids
-    assert clone_agent.max_action == matd3.max_action
-    assert clone_agent.min_action == matd3.min_action
-    assert np.array_equal(clone_agent.expl_noise, matd3.expl_noise)
-    assert clone_agent.discrete_actions == matd3.discrete_actions
-    assert clone_agent.index == matd3.index
-    assert clone_agent.net_config == matd3.net_config
-    assert clone_agent.batch_size == matd3.batch_size
-    assert clone_agent.lr_actor == matd3.lr_actor
-    assert clone_agent.lr_critic == matd3.lr_critic
-    assert clone_agent.learn_step == matd3.learn_step
-    assert clone_agent.gamma == matd3.gamma
-    assert clone_agent.tau == matd3.tau
-    assert clone_agent.device == matd3.device
-    assert clone_agent.accelerator == matd3.accelerator
+    _assert_clone_config_equal(clone_agent, matd3)
     for clone_actor, actor in zip(clone_agent.actors, matd3.actors):
-        assert str(clone_actor.state_dict()) == str(actor.state_dict())
+        _assert_state_dicts_equal(clone_actor, actor)
     for clone_critic_1, critic_1 in zip(clone_agent.critics_1, matd3.critics_1):
-        assert str(clone_critic_1.state_dict()) == str(critic_1.state_dict())
+        _assert_state_dicts_equal(clone_critic_1, critic_1)
     for clone_actor_target, actor_target in zip(
         clone_agent.actor_targets, matd3.actor_targets
     ):
-        assert str(clone_actor_target.state_dict()) == str(actor_target.state_dict())
+        _assert_state_dicts_equal(clone_actor_target, actor_target)
     for clone_critic_target_1, critic_target_1 in zip(
         clone_agent.critic_targets_1, matd3.critic_targets_1
     ):
-        assert str(clone_critic_target_1.state_dict()) == str(
-            critic_target_1.state_dict()
-        )
-
+        _assert_state_dicts_equal(clone_critic_target_1, critic_target_1)
     for clone_critic_2, critic_2 in zip(clone_agent.critics_2, matd3.critics_2):
-        assert str(clone_critic_2.state_dict()) == str(critic_2.state_dict())
-
+        _assert_state_dicts_equal(clone_critic_2, critic_2)
     for clone_critic_target_2, critic_target_2 in zip(
         clone_agent.critic_targets_2, matd3.critic_targets_2
     ):
-        assert str(clone_critic_target_2.state_dict()) == str(
-            critic_target_2.state_dict()
-        )
+        _assert_state_dicts_equal(clone_critic_target_2, critic_target_2)
 
     assert clone_agent.actor_networks == matd3.actor_networks
     assert clone_agent.critic_networks == matd3.critic_networks
@@ -1742,7 +1946,7 @@ def test_clone_new_index():
     action_dims = [2, 2]
     one_hot = False
     n_agents = 2
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     max_action = [(1,), (1,)]
     min_action = [(-1,), (-1,)]
     discrete_actions = False
@@ -1767,7 +1971,7 @@ def test_clone_after_learning():
     action_dims = [2, 2]
     one_hot = False
     n_agents = 2
-    agent_ids = ["agent_0", "agent_1"]
+    agent_ids = AGENT_IDS
     max_action = [(1,), (1,)]
     min_action = [(-1,), (-1,)]
     discrete_actions = False
@@ -1785,69 +1989,45 @@ def test_clone_after_learning():
         batch_size=batch_size,
     )
 
-    states = {
-        agent_id: torch.randn(batch_size, state_dims[idx][0])
-        for idx, agent_id in enumerate(agent_ids)
-    }
-    actions = {
-        agent_id: torch.randn(batch_size, action_dims[idx])
-        for idx, agent_id in enumerate(agent_ids)
-    }
-    rewards = {agent_id: torch.randn(batch_size, 1) for agent_id in agent_ids}
+    n_agents_batch = len(agent_ids)
+    state_batch = _randn(n_agents_batch, batch_size, state_dims[0][0])
+    action_batch = _randn(n_agents_batch, batch_size, action_dims[0])
+    reward_batch = _randn(n_agents_batch, batch_size, 1)
+    next_state_batch = _randn(n_agents_batch, batch_size, state_dims[0][0])
+    done_batch = torch.zeros(n_agents_batch, batch_size, 1)
+
+    states = {agent_id: state_batch[idx] for idx, agent_id in enumerate(agent_ids)}
+    actions = {agent_id: action_batch[idx] for idx, agent_id in enumerate(agent_ids)}
+    rewards = {agent_id: reward_batch[idx] for idx, agent_id in enumerate(agent_ids)}
     next_states = {
-        agent_id: torch.randn(batch_size, state_dims[idx][0])
-        for idx, agent_id in enumerate(agent_ids)
+        agent_id: next_state_batch[idx] for idx, agent_id in enumerate(agent_ids)
     }
-    dones = {agent_id: torch.zeros(batch_size, 1) for agent_id in agent_ids}
+    dones = {agent_id: done_batch[idx] for idx, agent_id in enumerate(agent_ids)}
 
     experiences = states, actions, rewards, next_states, dones
     matd3.learn(experiences)
     clone_agent = matd3.clone()
     assert isinstance(clone_agent, MATD3)
-    assert clone_agent.state_dims == matd3.state_dims
-    assert clone_agent.action_dims == matd3.action_dims
-    assert clone_agent.one_hot == matd3.one_hot
-    assert clone_agent.n_agents == matd3.n_agents
-    assert clone_agent.agent_ids == matd3.agent_ids
-    assert clone_agent.max_action == matd3.max_action
-    assert clone_agent.min_action == matd3.min_action
-    assert np.array_equal(clone_agent.expl_noise, matd3.expl_noise)
-    assert clone_agent.discrete_actions == matd3.discrete_actions
-    assert clone_agent.index == matd3.index
-    assert clone_agent.net_config == matd3.net_config
-    assert clone_agent.batch_size == matd3.batch_size
-    assert clone_agent.lr_actor == matd3.lr_actor
-    assert clone_agent.lr_critic == matd3.lr_critic
-    assert clone_agent.learn_step == matd3.learn_step
-    assert clone_agent.gamma == matd3.gamma
-    assert clone_agent.tau == matd3.tau
-    assert clone_agent.device == matd3.device
-    assert clone_agent.accelerator == matd3.accelerator
+    _assert_clone_config_equal(clone_agent, matd3)
 
     for clone_actor, actor in zip(clone_agent.actors, matd3.actors):
-        assert str(clone_actor.state_dict()) == str(actor.state_dict())
+        _assert_state_dicts_equal(clone_actor, actor)
     for clone_critic_1, critic_1 in zip(clone_agent.critics_1, matd3.critics_1):
-        assert str(clone_critic_1.state_dict()) == str(critic_1.state_dict())
+        _assert_state_dicts_equal(clone_critic_1, critic_1)
     for clone_actor_target, actor_target in zip(
         clone_agent.actor_targets, matd3.actor_targets
     ):
-        assert str(clone_actor_target.state_dict()) == str(actor_target.state_dict())
+        _assert_state_dicts_equal(clone_actor_target, actor_target)
     for clone_critic_target_1, critic_target_1 in zip(
         clone_agent.critic_targets_1, matd3.critic_targets_1
     ):
-        assert str(clone_critic_target_1.state_dict()) == str(
-            critic_target_1.state_dict()
-        )
-
+        _assert_state_dicts_equal(clone_critic_target_1, critic_target_1)
     for clone_critic_2, critic_2 in zip(clone_agent.critics_2, matd3.critics_2):
-        assert str(clone_critic_2.state_dict()) == str(critic_2.state_dict())
-
+        _assert_state_dicts_equal(clone_critic_2, critic_2)
     for clone_critic_target_2, critic_target_2 in zip(
         clone_agent.critic_targets_2, matd3.critic_targets_2
     ):
-        assert str(clone_critic_target_2.state_dict()) == str(
-            critic_target_2.state_dict()
-        )
+        _assert_state_dicts_equal(clone_critic_target_2, critic_target_2)
 
     for clone_actor_opt, actor_opt in zip(
         clone_agent.actor_optimizers, matd3.actor_optimizers
@@ -1866,7 +2046,7 @@ def test_clone_after_learning():
     assert clone_agent.critic_networks == matd3.critic_networks
 
 
-def test_matd3_save_load_checkpoint_correct_data_and_format(tmpdir):
+def test_matd3_save_load_checkpoint_correct_data_and_format():
     net_config = {"arch": "mlp", "hidden_size": [32, 32]}
     # Initialize the ddpg agent
     matd3 = MATD3(
@@ -1885,12 +2065,13 @@ def test_matd3_save_load_checkpoint_correct_data_and_format(tmpdir):
         discrete_actions=True,
     )
 
-    # Save the checkpoint to a file
-    checkpoint_path = Path(tmpdir) / "checkpoint.pth"
-    matd3.save_checkpoint(checkpoint_path)
+    # Save the checkpoint to an in-memory buffer
+    checkpoint_buffer = io.BytesIO()
+    matd3.save_checkpoint(checkpoint_buffer)
 
-    # Load the saved checkpoint file
-    checkpoint = torch.load(checkpoint_path, pickle_module=dill)
+    # Load the saved checkpoint
+    checkpoint_buffer.seek(0)
+    checkpoint = _load_checkpoint_file(checkpoint_buffer)
 
     # Check if the loaded checkpoint has the correct keys
     assert "actors_init_dict" in checkpoint
@@ -1937,44 +2118,29 @@ def test_matd3_save_load_checkpoint_correct_data_and_format(tmpdir):
         min_action=[(-1,)],
         discrete_actions=True,
     )
-    loaded_matd3.load_checkpoint(checkpoint_path)
+    checkpoint_buffer.seek(0)
+    loaded_matd3.load_checkpoint(checkpoint_buffer)
 
     # Check if properties and weights are loaded correctly
     assert loaded_matd3.net_config == net_config
-    assert all(isinstance(actor, EvolvableMLP) for actor in loaded_matd3.actors)
-    assert all(
-        isinstance(actor_target, EvolvableMLP)
-        for actor_target in loaded_matd3.actor_targets
-    )
-    assert all(
-        isinstance(critic_1, EvolvableMLP) for critic_1 in loaded_matd3.critics_1
-    )
-    assert all(
-        isinstance(critic_target_1, EvolvableMLP)
-        for critic_target_1 in loaded_matd3.critic_targets_1
-    )
     assert all(
-        isinstance(critic_2, EvolvableMLP) for critic_2 in loaded_matd3.critics_2
-    )
-    assert all(
-        isinstance(critic_target_2, EvolvableMLP)
-        for critic_target_2 in loaded_matd3.critic_targets_2
+        isinstance(network, EvolvableMLP) for network in _all_networks(loaded_matd3)
     )
     assert matd3.lr_actor == 0.001
     assert matd3.lr_critic == 0.01
 
     for actor, actor_target in zip(loaded_matd3.actors, loaded_matd3.actor_targets):
-        assert str(actor.state_dict()) == str(actor_target.state_dict())
+        _assert_state_dicts_equal(actor, actor_target)
 
     for critic_1, critic_target_1 in zip(
         loaded_matd3.critics_1, loaded_matd3.critic_targets_1
     ):
-        assert str(critic_1.state_dict()) == str(critic_target_1.state_dict())
+        _assert_state_dicts_equal(critic_1, critic_target_1)
 
     for critic_2, critic_target_2 in zip(
         loaded_matd3.critics_2, loaded_matd3.critic_targets_2
     ):
-        assert str(critic_2.state_dict()) == str(critic_target_2.state_dict())
+        _assert_state_dicts_equal(critic_2, critic_target_2)
 
     assert matd3.batch_size == 64
     assert matd3.learn_step == 5
@@ -1988,7 +2154,8 @@ def test_matd3_save_load_checkpoint_correct_data_and_format(tmpdir):
     assert matd3.policy_freq == 2
 
 
-def test_matd3_save_load_checkpoint_correct_data_and_format_cnn(tmpdir):
+@pytest.mark.slow
+def test_matd3_save_load_checkpoint_correct_data_and_format_cnn():
     net_config_cnn = {
         "arch": "cnn",
         "hidden_size": [8],
@@ -2012,12 +2179,13 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_cnn(tmpdir):
         policy_freq=policy_freq,
     )
 
-    # Save the checkpoint to a file
-    checkpoint_path = Path(tmpdir) / "checkpoint.pth"
-    matd3.save_checkpoint(checkpoint_path)
+    # Save the checkpoint to an in-memory buffer
+    checkpoint_buffer = io.BytesIO()
+    matd3.save_checkpoint(checkpoint_buffer)
 
-    # Load the saved checkpoint file
-    checkpoint = torch.load(checkpoint_path, pickle_module=dill)
+    # Load the saved checkpoint
+    checkpoint_buffer.seek(0)
+    checkpoint = _load_checkpoint_file(checkpoint_buffer)
 
     # Check if the loaded checkpoint has the correct keys
     assert "actors_init_dict" in checkpoint
@@ -2060,44 +2228,29 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_cnn(tmpdir):
         min_action=[(-1,)],
         discrete_actions=True,
     )
-    loaded_matd3.load_checkpoint(checkpoint_path)
+    checkpoint_buffer.seek(0)
+    loaded_matd3.load_checkpoint(checkpoint_buffer)
 
     # Check if properties and weights are loaded correctly
     assert loaded_matd3.net_config == net_config_cnn
-    assert all(isinstance(actor, EvolvableCNN) for actor in loaded_matd3.actors)
-    assert all(
-        isinstance(actor_target, EvolvableCNN)
-        for actor_target in loaded_matd3.actor_targets
-    )
-    assert all(
-        isinstance(critic_1, EvolvableCNN) for critic_1 in loaded_matd3.critics_1
-    )
-    assert all(
-        isinstance(critic_target_1, EvolvableCNN)
-        for critic_target_1 in loaded_matd3.critic_targets_1
-    )
-    assert all(
-        isinstance(critic_2, EvolvableCNN) for critic_2 in loaded_matd3.critics_2
-    )
     assert all(
-        isinstance(critic_target_2, EvolvableCNN)
-        for critic_target_2 in loaded_matd3.critic_targets_2
+        isinstance(network, EvolvableCNN) for network in _all_networks(loaded_matd3)
     )
     assert matd3.lr_actor == 0.001
     assert matd3.lr_critic == 0.01
 
     for actor, actor_target in zip(loaded_matd3.actors, loaded_matd3.actor_targets):
-        assert str(actor.state_dict()) == str(actor_target.state_dict())
+        _assert_state_dicts_equal(actor, actor_target)
 
     for critic_1, critic_target_1 in zip(
         loaded_matd3.critics_1, loaded_matd3.critic_targets_1
     ):
-        assert str(critic_1.state_dict()) == str(critic_target_1.state_dict())
+        _assert_state_dicts_equal(critic_1, critic_target_1)
 
     for critic_2, critic_target_2 in zip(
         loaded_matd3.critics_2, loaded_matd3.critic_targets_2
     ):
-        assert str(critic_2.state_dict()) == str(critic_target_2.state_dict())
+        _assert_state_dicts_equal(critic_2, critic_target_2)
 
     assert matd3.batch_size == 64
     assert matd3.learn_step == 5
@@ -2111,35 +2264,19 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_cnn(tmpdir):
     assert matd3.policy_freq == policy_freq
 
 
-@pytest.mark.parametrize(
-    "state_dims, action_dims",
-    [
-        (
-            [
-                [
-                    6,
-                ]
-            ],
-            [2],
-        )
-    ],
-)
+@pytest.mark.parametrize("state_dims, action_dims", [([[6]], [2])])
 def test_matd3_save_load_checkpoint_correct_data_and_format_make_evo(
-    tmpdir, state_dims, action_dims, mlp_actor, mlp_critic, device
+    state_dims, action_dims, mlp_actor, mlp_critic, device
 ):
     evo_actors = [
-        MakeEvolvable(network=mlp_actor, input_tensor=torch.randn(1, 6), device=device)
-        for _ in range(1)
-    ]
-    evo_critics_1 = [
-        MakeEvolvable(network=mlp_critic, input_tensor=torch.randn(1, 8), device=device)
-        for _ in range(1)
-    ]
-    evo_critics_2 = [
-        MakeEvolvable(network=mlp_critic, input_tensor=torch.randn(1, 8), device=device)
-        for _ in range(1)
+        _make_evolvable(
+            network=mlp_actor, input_tensor=_input_tensor(1, 6), device=device
+        )
     ]
-    evo_critics = [evo_critics_1, evo_critics_2]
+    evo_critic = _make_evolvable(
+        network=mlp_critic, input_tensor=_input_tensor(1, 8), device=device
+    )
+    evo_critics = [[evo_critic], [copy.deepcopy(evo_critic)]]
     matd3 = MATD3(
         state_dims=state_dims,
         action_dims=action_dims,
@@ -2153,12 +2290,13 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_make_evo(
         critic_networks=evo_critics,
         device=device,
     )
-    # Save the checkpoint to a file
-    checkpoint_path = Path(tmpdir) / "checkpoint.pth"
-    matd3.save_checkpoint(checkpoint_path)
+    # Save the checkpoint to an in-memory buffer
+    checkpoint_buffer = io.BytesIO()
+    matd3.save_checkpoint(checkpoint_buffer)
 
-    # Load the saved checkpoint file
-    checkpoint = torch.load(checkpoint_path, pickle_module=dill)
+    # Load the saved checkpoint
+    checkpoint_buffer.seek(0)
+    checkpoint = _load_checkpoint_file(checkpoint_buffer)
 
     # Check if the loaded checkpoint has the correct keys
     assert "actors_init_dict" in checkpoint
@@ -2201,7 +2339,8 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_make_evo(
         min_action=[(-1,)],
         discrete_actions=True,
     )
-    loaded_matd3.load_checkpoint(checkpoint_path)
+    checkpoint_buffer.seek(0)
+    loaded_matd3.load_checkpoint(checkpoint_buffer)
 
     # Check if properties and weights are loaded correctly
     assert all(isinstance(actor, MakeEvolvable) for actor in loaded_matd3.actors)
@@ -2227,17 +2366,17 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_make_evo(
     assert matd3.lr_critic == 0.01
 
     for actor, actor_target in zip(loaded_matd3.actors, loaded_matd3.actor_targets):
-        assert str(actor.state_dict()) == str(actor_target.state_dict())
+        _assert_state_dicts_equal(actor, actor_target)
 
     for critic_1, critic_target_1 in zip(
         loaded_matd3.critics_1, loaded_matd3.critic_targets_1
     ):
-        assert str(critic_1.state_dict()) == str(critic_target_1.state_dict())
+        _assert_state_dicts_equal(critic_1, critic_target_1)
 
     for critic_2, critic_target_2 in zip(
         loaded_matd3.critics_2, loaded_matd3.critic_targets_2
     ):
-        assert str(critic_2.state_dict()) == str(critic_target_2.state_dict())
+        _assert_state_dicts_equal(critic_2, critic_target_2)
 
     assert matd3.batch_size == 64
     assert matd3.learn_step == 5
@@ -2252,315 +2391,203 @@ def test_matd3_save_load_checkpoint_correct_data_and_format_make_evo(
 
 
 def test_matd3_unwrap_models():
-    state_dims = [(6,), (6,)]
+    state_dims = MLP_STATE_DIMS
     action_dims = [2, 2]
-    accelerator = Accelerator()
+    accelerator = _shared_accelerator()
     matd3 = MATD3(
         state_dims,
         action_dims,
         one_hot=False,
         n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         max_action=[[1], [1]],
         min_action=[[-1], [-1]],
         discrete_actions=True,
         accelerator=accelerator,
     )
     matd3.unwrap_models()
-    for (
-        actor,
-        critic_1,
-        critic_2,
-        actor_target,
-        critic_target_1,
-        critic_target_2,
-    ) in zip(
-        matd3.actors,
-        matd3.critics_1,
-        matd3.critics_2,
-        matd3.actor_targets,
-        matd3.critic_targets_1,
-        matd3.critic_targets_2,
-    ):
-        assert isinstance(actor, nn.Module)
-        assert isinstance(actor_target, nn.Module)
-        assert isinstance(critic_1, nn.Module)
-        assert isinstance(critic_target_1, nn.Module)
-        assert isinstance(critic_2, nn.Module)
-        assert isinstance(critic_target_2, nn.Module)
+    for network in _all_networks(matd3):
+        assert isinstance(network, nn.Module)
 
 
 # Returns the input action scaled to the action space defined by self.min_action and self.max_action.
-def test_action_scaling():
-    action = torch.Tensor([0.1, 0.2, 0.3, -0.1, -0.2, -0.3])
-    max_actions = [(1,), (2,), (1,), (2,), (2,)]
-    min_actions = [(-1,), (-2,), (0,), (0,), (-1,)]
+_SIGNED_ACTION = torch.tensor([0.1, 0.2, 0.3, -0.1, -0.2, -0.3])
+_UNSIGNED_ACTION = torch.tensor([0.1, 0.2, 0.3, 0.0])
 
-    matd3 = MATD3(
-        state_dims=[[4], [4], [4], [4], [4]],
-        action_dims=[1, 1, 1, 1, 1],
-        n_agents=5,
-        agent_ids=["agent_0", "agent_1", "agent_2", "agent_3", "agent_4"],
-        discrete_actions=False,
-        one_hot=False,
-        max_action=max_actions,
-        min_action=min_actions,
-    )
-    matd3.actors[0].mlp_output_activation = "Tanh"
-    scaled_action = matd3.scale_to_action_space(action, idx=0)
-    assert torch.equal(scaled_action, torch.Tensor([0.1, 0.2, 0.3, -0.1, -0.2, -0.3]))
-
-    matd3.actors[1].mlp_output_activation = "Tanh"
-    action = torch.Tensor([0.1, 0.2, 0.3, -0.1, -0.2, -0.3])
-    scaled_action = matd3.scale_to_action_space(action, idx=1)
-    torch.testing.assert_close(
-        scaled_action, torch.Tensor([0.2, 0.4, 0.6, -0.2, -0.4, -0.6])
-    )
 
-    matd3.actors[2].mlp_output_activation = "Sigmoid"
-    action = torch.Tensor([0.1, 0.2, 0.3, 0])
-    scaled_action = matd3.scale_to_action_space(action, idx=2)
-    assert torch.equal(scaled_action, torch.Tensor([0.1, 0.2, 0.3, 0]))
-
-    matd3.actors[3].mlp_output_activation = "GumbelSoftmax"
-    action = torch.Tensor([0.1, 0.2, 0.3, 0])
-    scaled_action = matd3.scale_to_action_space(action, idx=3)
-    assert torch.equal(scaled_action, torch.Tensor([0.2, 0.4, 0.6, 0]))
-
-    matd3.actors[4].mlp_output_activation = "Tanh"
-    action = torch.Tensor([0.1, 0.2, 0.3, -0.1, -0.2, -0.3])
-    scaled_action = matd3.scale_to_action_space(action, idx=4)
-    torch.testing.assert_close(
-        scaled_action,
-        torch.Tensor(
-            [
-                0.55 * 3 - 1,
-                0.6 * 3 - 1,
-                0.65 * 3 - 1,
-                0.45 * 3 - 1,
-                0.4 * 3 - 1,
-                0.35 * 3 - 1,
-            ]
+@pytest.mark.parametrize(
+    "mlp_output_activation, min_action, max_action, action, expected",
+    [
+        ("Tanh", (-1,), (1,), _SIGNED_ACTION, _SIGNED_ACTION),
+        ("Tanh", (-2,), (2,), _SIGNED_ACTION, 2 * _SIGNED_ACTION),
+        ("Sigmoid", (0,), (1,), _UNSIGNED_ACTION, _UNSIGNED_ACTION),
+        ("GumbelSoftmax", (0,), (2,), _UNSIGNED_ACTION, 2 * _UNSIGNED_ACTION),
+        (
+            "Tanh",
+            (-1,),
+            (2,),
+            _SIGNED_ACTION,
+            torch.tensor(
+                [
+                    0.55 * 3 - 1,
+                    0.6 * 3 - 1,
+                    0.65 * 3 - 1,
+                    0.45 * 3 - 1,
+                    0.4 * 3 - 1,
+                    0.35 * 3 - 1,
+                ]
+            ),
         ),
+    ],
+)
+def test_action_scaling(
+    mlp_output_activation, min_action, max_action, action, expected
+):
+    matd3 = _get_matd3(
+        ("action_scaling", min_action, max_action),
+        state_dims=[[4]],
+        action_dims=[1],
+        n_agents=1,
+        agent_ids=["agent_0"],
+        discrete_actions=False,
+        one_hot=False,
+        max_action=[max_action],
+        min_action=[min_action],
     )
+    actor = matd3.actors[0]
+    original_activation = actor.mlp_output_activation
+    actor.mlp_output_activation = mlp_output_activation
+    try:
+        scaled_action = matd3.scale_to_action_space(action, idx=0)
+    finally:
+        # the agent is cached, so undo the activation override
+        actor.mlp_output_activation = original_activation
+    torch.testing.assert_close(scaled_action, expected)
+
+
+@pytest.fixture(scope="module")
+def mlp_pretrained_checkpoint(tmp_path_factory):
+    """Reference MLP agent and its saved checkpoint, shared across the
+    load_from_pretrained parametrize matrix."""
+    # fork_rng keeps the deterministic seed local to this fixture instead
+    # of resetting the process-global RNG mid-session
+    with torch.random.fork_rng():
+        torch.manual_seed(0)
+        matd3 = MATD3(
+            state_dims=[[4], [4]],
+            action_dims=[2, 2],
+            one_hot=False,
+            n_agents=2,
+            agent_ids=AGENT_IDS,
+            max_action=[[1], [1]],
+            min_action=[[-1], [-1]],
+            discrete_actions=True,
+        )
+    checkpoint_path = tmp_path_factory.mktemp("pretrained") / "checkpoint.pth"
+    matd3.save_checkpoint(checkpoint_path)
+    return matd3, checkpoint_path
 
 
 @pytest.mark.parametrize(
     "device, accelerator",
     [
         ("cpu", None),
-        ("cpu", Accelerator()),
+        ("cpu", "accelerator"),
     ],
 )
 # The saved checkpoint file contains the correct data and format.
-def test_load_from_pretrained(device, accelerator, tmpdir):
-    # Initialize the matd3 agent
-    matd3 = MATD3(
-        state_dims=[[4], [4]],
-        action_dims=[2, 2],
-        one_hot=False,
-        n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
-        max_action=[[1], [1]],
-        min_action=[[-1], [-1]],
-        discrete_actions=True,
-    )
-
-    # Save the checkpoint to a file
-    checkpoint_path = Path(tmpdir) / "checkpoint.pth"
-    matd3.save_checkpoint(checkpoint_path)
+def test_load_from_pretrained(device, accelerator, mlp_pretrained_checkpoint):
+    # The reference agent and checkpoint are built once per module
+    matd3, checkpoint_path = mlp_pretrained_checkpoint
+    # "accelerator" is a placeholder so collection doesn't construct one
+    if accelerator == "accelerator":
+        accelerator = _shared_accelerator()
 
     # Create new agent object
     new_matd3 = MATD3.load(checkpoint_path, device=device, accelerator=accelerator)
 
     # Check if properties and weights are loaded correctly
-    assert new_matd3.state_dims == matd3.state_dims
-    assert new_matd3.action_dims == matd3.action_dims
-    assert new_matd3.one_hot == matd3.one_hot
-    assert new_matd3.n_agents == matd3.n_agents
-    assert new_matd3.agent_ids == matd3.agent_ids
-    assert new_matd3.min_action == matd3.min_action
-    assert new_matd3.max_action == matd3.max_action
-    assert new_matd3.net_config == matd3.net_config
-    assert new_matd3.lr_actor == matd3.lr_actor
-    assert new_matd3.lr_critic == matd3.lr_critic
-    for (
-        new_actor,
-        new_actor_target,
-        new_critic_1,
-        new_critic_target_1,
-        new_critic_2,
-        new_critic_target_2,
-        actor,
-        actor_target,
-        critic_1,
-        critic_target_1,
-        critic_2,
-        critic_target_2,
-    ) in zip(
-        new_matd3.actors,
-        new_matd3.actor_targets,
-        new_matd3.critics_1,
-        new_matd3.critic_targets_1,
-        new_matd3.critics_2,
-        new_matd3.critic_targets_2,
-        matd3.actors,
-        matd3.actor_targets,
-        matd3.critics_1,
-        matd3.critic_targets_1,
-        matd3.critics_2,
-        matd3.critic_targets_2,
-    ):
-        assert isinstance(new_actor, EvolvableMLP)
-        assert isinstance(new_actor_target, EvolvableMLP)
-        assert isinstance(new_critic_1, EvolvableMLP)
-        assert isinstance(new_critic_target_1, EvolvableMLP)
-        assert isinstance(new_critic_2, EvolvableMLP)
-        assert isinstance(new_critic_target_2, EvolvableMLP)
-        assert str(new_actor.to("cpu").state_dict()) == str(actor.state_dict())
-        assert str(new_actor_target.to("cpu").state_dict()) == str(
-            actor_target.state_dict()
-        )
-        assert str(new_critic_1.to("cpu").state_dict()) == str(critic_1.state_dict())
-        assert str(new_critic_target_1.to("cpu").state_dict()) == str(
-            critic_target_1.state_dict()
-        )
-        assert str(new_critic_2.to("cpu").state_dict()) == str(critic_2.state_dict())
-        assert str(new_critic_target_2.to("cpu").state_dict()) == str(
-            critic_target_2.state_dict()
+    _assert_loaded_config_equal(new_matd3, matd3)
+    assert all(
+        isinstance(network, EvolvableMLP) for network in _all_networks(new_matd3)
+    )
+    _assert_all_networks_equal(new_matd3, matd3)
+
+
+@pytest.fixture(scope="module")
+def cnn_pretrained_checkpoint(tmp_path_factory):
+    """Reference CNN agent and its saved checkpoint, shared across the
+    load_from_pretrained_cnn parametrize matrix."""
+    with torch.random.fork_rng():
+        torch.manual_seed(0)
+        matd3 = MATD3(
+            state_dims=[[3, 32, 32], [3, 32, 32]],
+            action_dims=[2, 2],
+            one_hot=False,
+            n_agents=2,
+            agent_ids=["agent_a", "agent_b"],
+            max_action=[[1], [1]],
+            min_action=[[-1], [-1]],
+            discrete_actions=False,
+            net_config={
+                "arch": "cnn",
+                "hidden_size": [8],
+                "channel_size": [3],
+                "kernel_size": [3],
+                "stride_size": [1],
+                "normalize": False,
+            },
         )
-    assert new_matd3.batch_size == matd3.batch_size
-    assert new_matd3.learn_step == matd3.learn_step
-    assert new_matd3.gamma == matd3.gamma
-    assert new_matd3.tau == matd3.tau
-    assert new_matd3.mut == matd3.mut
-    assert new_matd3.index == matd3.index
-    assert new_matd3.scores == matd3.scores
-    assert new_matd3.fitness == matd3.fitness
-    assert new_matd3.steps == matd3.steps
+    checkpoint_path = tmp_path_factory.mktemp("pretrained_cnn") / "checkpoint.pth"
+    matd3.save_checkpoint(checkpoint_path)
+    return matd3, checkpoint_path
 
 
 @pytest.mark.parametrize(
     "device, accelerator",
     [
         ("cpu", None),
-        ("cpu", Accelerator()),
+        ("cpu", "accelerator"),
     ],
 )
 # The saved checkpoint file contains the correct data and format.
-def test_load_from_pretrained_cnn(device, accelerator, tmpdir):
-    # Initialize the matd3 agent
-    matd3 = MATD3(
-        state_dims=[[3, 32, 32], [3, 32, 32]],
-        action_dims=[2, 2],
-        one_hot=False,
-        n_agents=2,
-        agent_ids=["agent_a", "agent_b"],
-        max_action=[[1], [1]],
-        min_action=[[-1], [-1]],
-        discrete_actions=False,
-        net_config={
-            "arch": "cnn",
-            "hidden_size": [8],
-            "channel_size": [3],
-            "kernel_size": [3],
-            "stride_size": [1],
-            "normalize": False,
-        },
-    )
-
-    # Save the checkpoint to a file
-    checkpoint_path = Path(tmpdir) / "checkpoint.pth"
-    matd3.save_checkpoint(checkpoint_path)
+@pytest.mark.slow
+def test_load_from_pretrained_cnn(device, accelerator, cnn_pretrained_checkpoint):
+    # The reference agent and checkpoint are built once per module
+    matd3, checkpoint_path = cnn_pretrained_checkpoint
+    # "accelerator" is a placeholder so collection doesn't construct one
+    if accelerator == "accelerator":
+        accelerator = _shared_accelerator()
 
     # Create new agent object
     new_matd3 = MATD3.load(checkpoint_path, device=device, accelerator=accelerator)
 
     # Check if properties and weights are loaded correctly
-    assert new_matd3.state_dims == matd3.state_dims
-    assert new_matd3.action_dims == matd3.action_dims
-    assert new_matd3.one_hot == matd3.one_hot
-    assert new_matd3.n_agents == matd3.n_agents
-    assert new_matd3.agent_ids == matd3.agent_ids
-    assert new_matd3.min_action == matd3.min_action
-    assert new_matd3.max_action == matd3.max_action
-    assert new_matd3.net_config == matd3.net_config
-    assert new_matd3.lr_actor == matd3.lr_actor
-    assert new_matd3.lr_critic == matd3.lr_critic
-    for (
-        new_actor,
-        new_actor_target,
-        new_critic_1,
-        new_critic_target_1,
-        new_critic_2,
-        new_critic_target_2,
-        actor,
-        actor_target,
-        critic_1,
-        critic_target_1,
-        critic_2,
-        critic_target_2,
-    ) in zip(
-        new_matd3.actors,
-        new_matd3.actor_targets,
-        new_matd3.critics_1,
-        new_matd3.critic_targets_1,
-        new_matd3.critics_2,
-        new_matd3.critic_targets_2,
-        matd3.actors,
-        matd3.actor_targets,
-        matd3.critics_1,
-        matd3.critic_targets_1,
-        matd3.critics_2,
-        matd3.critic_targets_2,
-    ):
-        assert isinstance(new_actor, EvolvableCNN)
-        assert isinstance(new_actor_target, EvolvableCNN)
-        assert isinstance(new_critic_1, EvolvableCNN)
-        assert isinstance(new_critic_target_1, EvolvableCNN)
-        assert isinstance(new_critic_2, EvolvableCNN)
-        assert isinstance(new_critic_target_2, EvolvableCNN)
-        assert str(new_actor.to("cpu").state_dict()) == str(actor.state_dict())
-        assert str(new_actor_target.to("cpu").state_dict()) == str(
-            actor_target.state_dict()
-        )
-        assert str(new_critic_1.to("cpu").state_dict()) == str(critic_1.state_dict())
-        assert str(new_critic_target_1.to("cpu").state_dict()) == str(
-            critic_target_1.state_dict()
-        )
-        assert str(new_critic_2.to("cpu").state_dict()) == str(critic_2.state_dict())
-        assert str(new_critic_target_2.to("cpu").state_dict()) == str(
-            critic_target_2.state_dict()
-        )
-    assert new_matd3.batch_size == matd3.batch_size
-    assert new_matd3.learn_step == matd3.learn_step
-    assert new_matd3.gamma == matd3.gamma
-    assert new_matd3.tau == matd3.tau
-    assert new_matd3.mut == matd3.mut
-    assert new_matd3.index == matd3.index
-    assert new_matd3.scores == matd3.scores
-    assert new_matd3.fitness == matd3.fitness
-    assert new_matd3.steps == matd3.steps
+    _assert_loaded_config_equal(new_matd3, matd3)
+    assert all(
+        isinstance(network, EvolvableCNN) for network in _all_networks(new_matd3)
+    )
+    _assert_all_networks_equal(new_matd3, matd3)
 
 
 @pytest.mark.parametrize(
-    "state_dims, action_dims, arch, input_tensor, critic_input_tensor, secondary_input_tensor",
+    "state_dims, action_dims, arch, input_shape, critic_input_shape, secondary_input_shape",
     [
         (
             [[4], [4]],
             [2, 2],
             "mlp",
-            torch.randn(1, 4),
-            torch.randn(1, 6),
+            (1, 4),
+            (1, 6),
             None,
         ),
         (
             [[4, 210, 160], [4, 210, 160]],
             [2, 2],
             "cnn",
-            torch.randn(1, 4, 2, 210, 160),
-            torch.randn(1, 4, 2, 210, 160),
-            torch.randn(1, 2),
+            (1, 4, 2, 210, 160),
+            (1, 4, 2, 210, 160),
+            (1, 2),
         ),
     ],
 )
@@ -2573,9 +2600,9 @@ def test_load_from_pretrained_networks(
     state_dims,
     action_dims,
     arch,
-    input_tensor,
-    critic_input_tensor,
-    secondary_input_tensor,
+    input_shape,
+    critic_input_shape,
+    secondary_input_shape,
     tmpdir,
 ):
     one_hot = False
@@ -2586,28 +2613,43 @@ def test_load_from_pretrained_networks(
         actor_network = cnn_actor
         critic_network = cnn_critic
 
-    actor_network = MakeEvolvable(actor_network, input_tensor)
-    critic_network = MakeEvolvable(
+    # Probe tensors are resolved lazily so collection doesn't allocate the
+    # large CNN inputs
+    input_tensor = _input_tensor(*input_shape)
+    critic_input_tensor = _input_tensor(*critic_input_shape)
+    secondary_input_tensor = (
+        _input_tensor(*secondary_input_shape)
+        if secondary_input_shape is not None
+        else None
+    )
+
+    actor_network = _make_evolvable(actor_network, input_tensor)
+    critic_network = _make_evolvable(
         critic_network,
         critic_input_tensor,
         secondary_input_tensor=secondary_input_tensor,
     )
 
+    # Each agent slot needs its own module instance, so copy the traced
+    # prototypes up front rather than inline in the constructor call
+    actor_networks = [actor_network, copy.deepcopy(actor_network)]
+    critic_networks = [
+        [critic_network, copy.deepcopy(critic_network)],
+        [copy.deepcopy(critic_network), copy.deepcopy(critic_network)],
+    ]
+
     # Initialize the matd3 agent
     matd3 = MATD3(
         state_dims=state_dims,
         action_dims=action_dims,
         one_hot=one_hot,
         n_agents=2,
-        agent_ids=["agent_0", "agent_1"],
+        agent_ids=AGENT_IDS,
         max_action=[[1], [1]],
         min_action=[[-1], [-1]],
         discrete_actions=True,
-        actor_networks=[actor_network, copy.deepcopy(actor_network)],
-        critic_networks=[
-            [critic_network, copy.deepcopy(critic_network)],
-            [copy.deepcopy(critic_network), copy.deepcopy(critic_network)],
-        ],
+        actor_networks=actor_networks,
+        critic_networks=critic_networks,
     )
 
     # Save the checkpoint to a file
@@ -2618,67 +2660,6 @@ def test_load_from_pretrained_networks(
     new_matd3 = MATD3.load(checkpoint_path)
 
     # Check if properties and weights are loaded correctly
-    assert new_matd3.state_dims == matd3.state_dims
-    assert new_matd3.action_dims == matd3.action_dims
-    assert new_matd3.one_hot == matd3.one_hot
-    assert new_matd3.n_agents == matd3.n_agents
-    assert new_matd3.agent_ids == matd3.agent_ids
-    assert new_matd3.min_action == matd3.min_action
-    assert new_matd3.max_action == matd3.max_action
-    assert new_matd3.net_config == matd3.net_config
-    assert new_matd3.lr_actor == matd3.lr_actor
-    assert new_matd3.lr_critic == matd3.lr_critic
-    for (
-        new_actor,
-        new_actor_target,
-        new_critic_1,
-        new_critic_target_1,
-        new_critic_2,
-        new_critic_target_2,
-        actor,
-        actor_target,
-        critic_1,
-        critic_target_1,
-        critic_2,
-        critic_target_2,
-    ) in zip(
-        new_matd3.actors,
-        new_matd3.actor_targets,
-        new_matd3.critics_1,
-        new_matd3.critic_targets_1,
-        new_matd3.critics_2,
-        new_matd3.critic_targets_2,
-        matd3.actors,
-        matd3.actor_targets,
-        matd3.critics_1,
-        matd3.critic_targets_1,
-        matd3.critics_2,
-        matd3.critic_targets_2,
-    ):
-        assert isinstance(new_actor, nn.Module)
-        assert isinstance(new_actor_target, nn.Module)
-        assert isinstance(new_critic_1, nn.Module)
-        assert isinstance(new_critic_target_1, nn.Module)
-        assert isinstance(new_critic_2, nn.Module)
-        assert isinstance(new_critic_target_2, nn.Module)
-        assert str(new_actor.to("cpu").state_dict()) == str(actor.state_dict())
-        assert str(new_actor_target.to("cpu").state_dict()) == str(
-            actor_target.state_dict()
-        )
-        assert str(new_critic_1.to("cpu").state_dict()) == str(critic_1.state_dict())
-        assert str(new_critic_target_1.to("cpu").state_dict()) == str(
-            critic_target_1.state_dict()
-        )
-        assert str(new_critic_2.to("cpu").state_dict()) == str(critic_2.state_dict())
-        assert str(new_critic_target_2.to("cpu").state_dict()) == str(
-            critic_target_2.state_dict()
-        )
-    assert new_matd3.batch_size == matd3.batch_size
-    assert new_matd3.learn_step == matd3.learn_step
-    assert new_matd3.gamma == matd3.gamma
-    assert new_matd3.tau == matd3.tau
-    assert new_matd3.mut == matd3.mut
-    assert new_matd3.index == matd3.index
-    assert new_matd3.scores == matd3.scores
-    assert new_matd3.fitness == matd3.fitness
-    assert new_matd3.steps == matd3.steps
+    _assert_loaded_config_equal(new_matd3, matd3)
+    assert all(isinstance(network, nn.Module) for network in _all_networks(new_matd3))
+    _assert_all_networks_equal(new_matd3, matd3)